@@ -1,2 +1,11 @@
-from .classes import Collaborator, Repository, Licence, Installation, Release
-from .api import Webhook
+from .classes import Collaborator, Repository, Licence, Installation, Release, Commit
+from .api import Webhook, JsonCodec, get_codec
+from .dispatch import Dispatcher, PoolDispatcher, PartitionedDispatcher
+from .asgi import AsgiApp, create_asgi_app
+from .dedup import DeliveryCache, MemoryDeliveryCache, SQLiteDeliveryCache
+from .filters import HookFilter
+from .spool import Spool, SQLiteSpool
+from .metrics import MetricsSink, InMemorySink, PrometheusSink
+from .policy import HandlerPolicy, CircuitBreaker, CircuitOpenError
+from .coalesce import Coalescer
+from .batch import BatchHandler
@@ -0,0 +1,43 @@
+import argparse
+import json
+import sys
+
+from GitHook import replay
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m GitHook', description='Record and replay github webhook deliveries')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record = commands.add_parser('record', help='receive deliveries and append them to a file')
+    record.add_argument('output', help='file the deliveries are appended to, one json line each')
+    record.add_argument('--host', default='127.0.0.1')
+    record.add_argument('--port', type=int, default=8000)
+    record.add_argument('--endpoint', default='/', help='only record this endpoint, every path by default')
+
+    play = commands.add_parser('replay', help='replay recorded deliveries in-process and report latencies')
+    play.add_argument('input', nargs='?', default=replay.SAMPLES, help='recorded deliveries, the bundled samples by default')
+    play.add_argument('--app', help='"module:attribute" of the Webhook or Flask app, a no-op sink by default')
+    play.add_argument('--codec', help='json codec of the no-op sink')
+    play.add_argument('--concurrency', type=int, default=1)
+    play.add_argument('--rate', type=float, help='deliveries per second, unbounded by default')
+    play.add_argument('--repeat', type=int, default=1, help='times the recording is replayed')
+    play.add_argument('--secret', help='re-sign the deliveries with this secret')
+    play.add_argument('--json', action='store_true', help='print the report as json')
+
+    args = parser.parse_args(argv)
+    if args.command == 'record':
+        replay.recorder(args.output, args.endpoint).run(args.host, args.port)
+        return 0
+
+    deliveries = replay.load(args.input)
+    app = replay.load_target(args.app) if args.app else replay.sink(deliveries, args.codec)
+    secret = args.secret.encode('utf-8') if args.secret else None
+    report = replay.replay(app, deliveries, args.concurrency, args.rate, args.repeat, secret)
+
+    print(json.dumps(report, indent=2) if args.json else replay.format_report(report))
+    return 0 if all(stats['failures'] == 0 for stats in report['events'].values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
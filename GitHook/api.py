@@ -1,103 +1,775 @@
-import hashlib
+import asyncio
 import hmac
+import inspect
 import json
 import logging
-from typing import Type
+import os
+import time
+from concurrent.futures import Executor
+from functools import partial
+from itertools import groupby
+from typing import Type, Dict, List, Callable, Optional, Tuple, Union, Any, NamedTuple, AbstractSet
+from urllib.parse import parse_qs
 
 import six
 from flask import Flask, request, abort
+from werkzeug.exceptions import HTTPException
 
+from GitHook import metrics
+from GitHook.batch import BatchHandler
+from GitHook.coalesce import Coalescer
+from GitHook.dedup import DeliveryCache
+from GitHook.dispatch import Dispatcher, PoolDispatcher
+from GitHook.spool import Spool
 from GitHook.events import Event
+from GitHook.filters import HookFilter, HandlerIndex, Patterns, Selection
+from GitHook.metrics import MetricsSink, PrometheusSink
+from GitHook.policy import HandlerPolicy, PolicyHandler, CircuitBreaker, CircuitOpenError
+
+
+_logger = logging.getLogger("webhook")
+
+
+class JsonCodec:
+    def __init__(self, name: str, loads: Callable[[Union[bytes, bytearray, str]], Any]):
+        self._name = name
+        self._loads = loads
+
+    def loads(self, data: Union[bytes, bytearray, str]):
+        return self._loads(data)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __repr__(self):
+        return f'<JsonCodec "{self._name}">'
+
+
+def _load_codec(name: str) -> JsonCodec:
+    if name == 'orjson':
+        import orjson
+        return JsonCodec(name, orjson.loads)
+    if name == 'ujson':
+        import ujson
+        # ujson only reads str and bytes
+        return JsonCodec(name, lambda data: ujson.loads(bytes(data) if isinstance(data, bytearray) else data))
+    if name == 'simdjson':
+        import simdjson
+        return JsonCodec(name, simdjson.loads)
+    if name == 'json':
+        return JsonCodec(name, json.loads)
+    raise ValueError(f'Unknown json codec "{name}"')
+
+
+JSON_CODECS = ('orjson', 'ujson', 'simdjson', 'json')
+
+
+def get_codec(name: Union[str, JsonCodec] = None) -> JsonCodec:
+    if isinstance(name, JsonCodec):
+        return name
+    if name is not None:
+        return _load_codec(name)
+
+    # Fastest installed backend wins, the standard library is always there as a fallback
+    for codec in JSON_CODECS:
+        try:
+            return _load_codec(codec)
+        except ImportError:
+            continue
 
 
 class Webhook:
-    def __init__(self, app: Flask):
+    def __init__(self, app: Flask, dispatcher: Dispatcher = None, dedup: DeliveryCache = None,
+                 max_body_size: Optional[int] = 25 * 1024 * 1024, lazy: bool = False,
+                 codec: Union[str, JsonCodec] = None, spool: Spool = None, metrics: MetricsSink = None,
+                 metrics_route: str = None, fanout: Executor = None, coalescer: Coalescer = None):
         self._app: Flask = app
-        self._logger = logging.getLogger("webhook")
+        self._coalescer = coalescer
+        self._fanout = fanout
+        self._metrics = metrics
+        self._spool = spool
+        self._codec = get_codec(codec)
+        self._max_body_size = max_body_size
+        self._lazy = lazy
+        self._logger = _logger
+        self._dispatcher = dispatcher
+        self._dedup = dedup
+        self._hooks: Dict[str, 'EventHook'] = {}
+        self._batches: List[BatchHandler] = []
+
+        if metrics_route is not None:
+            if not isinstance(metrics, PrometheusSink):
+                raise ValueError('metrics_route requires a PrometheusSink')
+            app.add_url_rule(metrics_route, metrics_route, self._render_metrics, methods=['GET'])
+
+    def _render_metrics(self):
+        return self._metrics.render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+    def hook(self, endpoint: str, event: Type[Event], secret=None, action: Patterns = None, ref: Patterns = None,
+             branch: Patterns = None, repository: Patterns = None, sender: Patterns = None,
+             policy: HandlerPolicy = None, priority: int = 0):
+        def decorator(func):
+            self.add_hook(func, event, endpoint, secret, action, ref, branch, repository, sender, policy, priority)
+            return func
+
+        return decorator
+
+    def add_hook(self, func, event: Type[Event], endpoint: str, secret=None, action: Patterns = None,
+                 ref: Patterns = None, branch: Patterns = None, repository: Patterns = None, sender: Patterns = None,
+                 policy: HandlerPolicy = None, priority: int = 0):
+        hook = self._hooks.get(endpoint)
+        if hook is None:
+            hook = EventHook(self, endpoint, secret)
+        elif secret is not None and hook.secret != _encode_secret(secret):
+            raise ValueError(f'Endpoint "{endpoint}" is already registered with a different secret')
 
-    def hook(self, endpoint: str, event: Type[Event], secret=None):
+        filters = (action, ref, branch, repository, sender)
+        hook.add_event(func, event, HookFilter(*filters) if any(f is not None for f in filters) else None, policy,
+                       priority)
+        return hook
+
+    def batch(self, endpoint: str, event: Type[Event], size: int = 100, interval: float = 1.0, capacity: int = 1000,
+              secret=None, action: Patterns = None, ref: Patterns = None, branch: Patterns = None,
+              repository: Patterns = None, sender: Patterns = None, priority: int = 0):
         def decorator(func):
-            self.add_hook(func, event, endpoint, secret)
+            self.add_batch_hook(func, event, endpoint, size, interval, capacity, secret, action, ref, branch,
+                                repository, sender, priority)
             return func
 
         return decorator
 
-    def add_hook(self, func, event: Type[Event], endpoint: str, secret=None):
-        pass
+    def add_batch_hook(self, func, event: Type[Event], endpoint: str, size: int = 100, interval: float = 1.0,
+                       capacity: int = 1000, secret=None, action: Patterns = None, ref: Patterns = None,
+                       branch: Patterns = None, repository: Patterns = None, sender: Patterns = None,
+                       priority: int = 0) -> BatchHandler:
+        # func receives lists of events, pass the returned handler to EventHook.remove_event to unregister it
+        handler = BatchHandler(func, size, interval, capacity)
+        self.add_hook(handler, event, endpoint, secret, action, ref, branch, repository, sender, None, priority)
+        self._batches.append(handler)
+        return handler
+
+    def _register(self, hook: 'EventHook'):
+        if hook.endpoint in self._hooks:
+            raise ValueError(f'Endpoint "{hook.endpoint}" is already registered')
+        self._hooks[hook.endpoint] = hook
+
+    def get_hook(self, endpoint: str) -> Optional['EventHook']:
+        return self._hooks.get(endpoint)
+
+    def asgi_app(self, timeout: float = None, executor=None):
+        from GitHook.asgi import AsgiApp
+        return AsgiApp(list(self._hooks.values()), timeout, executor)
+
+    def serve(self, host: str = '127.0.0.1', port: int = 5000, workers: int = None, mode: str = 'reuseport',
+              queue_size: int = 64):
+        # reuseport: forks workers that each parse, verify and dispatch on their own socket.
+        # acceptor: this process parses and verifies, handlers run in a pool of worker processes
+        from GitHook import server
+        if mode not in server.MODES:
+            raise ValueError(f'Unknown serve mode "{mode}", expected one of {", ".join(server.MODES)}')
+        workers = workers if workers is not None else os.cpu_count() or 1
+
+        if mode == server.ACCEPTOR:
+            self._use_process_pool(workers, queue_size)
+        # Recovered up front so forked workers don't each replay the same entries, and what recovery left
+        # buffered is flushed so the workers don't inherit and flush it again
+        self.recover()
+        if self._coalescer is not None:
+            self._coalescer.flush()
+        for batch in self._batches:
+            batch.flush()
+
+        try:
+            if mode == server.ACCEPTOR:
+                server.run_acceptor(self._app, host, port)
+            else:
+                server.run_workers(self._app, host, port, workers, self._after_fork, self.shutdown)
+        finally:
+            self.shutdown()
+
+    def _use_process_pool(self, workers: int, queue_size: int):
+        if self._fanout is not None or any(hook._fanout is not None for hook in self._hooks.values()):
+            raise ValueError('Handlers can not fan out to threads when they run in worker processes')
+        if self._batches:
+            raise ValueError('Batch handlers can not buffer events in worker processes')
+        # Breakers hold locks that can't be pickled, and retry and breaker state would only live in per-job copies
+        if any(isinstance(handler.call, PolicyHandler)
+               for hook in self._hooks.values() for index in hook._events.values() for handler in index):
+            raise ValueError('Handlers with a policy can not run in worker processes')
+        if self._dispatcher is None:
+            self._dispatcher = PoolDispatcher(workers, queue_size, processes=True)
+        for hook in self._hooks.values():
+            if hook.dispatcher is None:
+                hook._dispatcher = self._dispatcher
+
+    def _after_fork(self):
+        if self._spool is not None:
+            self._spool.reopen()
+        caches = [self._dedup] + [hook.dedup for hook in self._hooks.values()]
+        # Hooks usually share the webhook's cache, each one is reopened once
+        for cache in {id(cache): cache for cache in caches if cache is not None}.values():
+            cache.reopen()
+
+    def recover(self) -> int:
+        # Replays deliveries left in the spool by a previous process, call once all hooks are registered
+        if self._spool is None:
+            return 0
+
+        # Only deliveries whose handlers ran are counted, unreadable and dead-lettered ones are not
+        replayed = 0
+        dead = 0
+        for entry, endpoint, headers, body in self._spool.pending():
+            hook = self._hooks.get(endpoint)
+            if hook is None:
+                self._logger.warning(f"Keeping spooled delivery {entry} of unknown endpoint {endpoint}")
+                continue
+            if not self._spool.attempt(entry):
+                self._logger.error(f"Spooled delivery {entry} of {endpoint} ran out of attempts, "
+                                   f"moved it to the dead letters")
+                dead += 1
+                continue
+            if hook._replay(entry, headers, body) is not None:
+                replayed += 1
+
+        if dead:
+            self._logger.warning(f"Moved {dead} spooled deliveries to the dead letters, see Spool.dead_letters")
+        return replayed
+
+    def shutdown(self, wait: bool = True):
+        # Held deliveries are handed to the dispatcher before it stops taking work
+        if self._coalescer is not None:
+            self._coalescer.flush()
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait)
+        # After the dispatcher so events its last jobs buffered are flushed too
+        for batch in self._batches:
+            batch.flush()
+        if self._spool is not None:
+            self._spool.close()
 
     @property
     def app(self) -> Flask:
         return self._app
 
+    @property
+    def dispatcher(self) -> Optional[Dispatcher]:
+        return self._dispatcher
+
+    @property
+    def dedup(self) -> Optional[DeliveryCache]:
+        return self._dedup
+
+    @property
+    def max_body_size(self) -> Optional[int]:
+        return self._max_body_size
+
+    @property
+    def lazy(self) -> bool:
+        return self._lazy
+
+    @property
+    def codec(self) -> JsonCodec:
+        return self._codec
+
+    @property
+    def spool(self) -> Optional[Spool]:
+        return self._spool
+
+    @property
+    def metrics(self) -> Optional[MetricsSink]:
+        return self._metrics
+
+    @property
+    def fanout(self) -> Optional[Executor]:
+        return self._fanout
+
+    @property
+    def coalescer(self) -> Optional[Coalescer]:
+        return self._coalescer
+
+    @property
+    def batches(self) -> List[BatchHandler]:
+        return list(self._batches)
+
+    @property
+    def hooks(self) -> List['EventHook']:
+        return list(self._hooks.values())
+
+    @property
+    def breakers(self) -> Dict[str, CircuitBreaker]:
+        breakers = {}
+        for hook in self._hooks.values():
+            breakers.update(hook.breakers)
+        return breakers
+
     @property
     def logger(self):
         return self._logger
 
 
+def _encode_secret(secret) -> Optional[bytes]:
+    if secret is not None and not isinstance(secret, six.binary_type):
+        secret = secret.encode("utf-8")
+    return secret
+
+
+def _event_name(event_type: Type[Event]) -> str:
+    name = event_type.__name__.lower()
+    if not name.endswith('_event'):
+        raise ValueError(f'"{event_type.__name__}" is not a valid event class name')
+    return name[:-len('_event')]
+
+
+def _handler_name(func) -> str:
+    return f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', repr(func))}"
+
+
+class DispatchResult(NamedTuple):
+    count: int
+    fails: int
+    # (handler name, seconds, succeeded) per call, only collected when metrics are enabled.
+    # succeeded is None for calls skipped by an open circuit
+    timings: Optional[List[Tuple[str, float, Optional[bool]]]] = None
+    skipped: int = 0
+    # Checkpoint keys of the handlers that succeeded, see _handler_keys
+    done: Tuple[str, ...] = ()
+
+
+def _handler_keys(handlers: List[Selection]) -> List[str]:
+    # Names handlers are checkpointed under, repeated names (lambdas of one module) are told apart by their order
+    seen: Dict[str, int] = {}
+    keys = []
+    for selection in handlers:
+        name = _handler_name(selection.call)
+        seen[name] = seen.get(name, 0) + 1
+        keys.append(name if seen[name] == 1 else f"{name}#{seen[name]}")
+    return keys
+
+
+def _build_events(handlers: List[Selection], data: dict,
+                  deliveries: List[str] = None) -> Dict[Type[Event], Optional[Event]]:
+    # One event per delivery and class, shared by every handler of that class. None if the payload doesn't fit
+    instances = {}
+    for selection in handlers:
+        if selection.event not in instances:
+            try:
+                instance = instances[selection.event] = selection.event(data)
+                if deliveries:
+                    Event.coalesced_deliveries.seed(instance, deliveries)
+            except Exception:
+                _logger.exception(f"Failed to build {selection.event.__name__} from the delivery")
+                instances[selection.event] = None
+    return instances
+
+
+def _call_handler(func, instance: Event, timed: bool = False,
+                  retried: Callable[[], None] = None) -> Tuple[Optional[str], float, Optional[bool]]:
+    # Only timed and named for metrics, the default dispatch pays for neither
+    started = time.perf_counter() if timed else 0.0
+    try:
+        result = func(instance) if retried is None else func(instance, retried)
+        if inspect.iscoroutine(result):
+            asyncio.run(result)
+        succeeded = True
+    except CircuitOpenError:
+        _logger.info(f"Skipped handler {_handler_name(func)}, its circuit is open")
+        succeeded = None
+    except Exception:
+        _logger.exception(f"Handler {_handler_name(func)} failed")
+        succeeded = False
+    if not timed:
+        return None, 0.0, succeeded
+    return _handler_name(func), time.perf_counter() - started, succeeded
+
+
+def _tally(calls: List[Tuple[Optional[str], float, Optional[bool]]], keys: List[Optional[str]], fails: int,
+           timed: bool) -> DispatchResult:
+    # keys holds the checkpoint key of each call, None when the delivery isn't spooled
+    failed = sum(1 for _, _, succeeded in calls if succeeded is False)
+    skipped = sum(1 for _, _, succeeded in calls if succeeded is None)
+    done = tuple(key for key, (_, _, succeeded) in zip(keys, calls) if succeeded and key is not None)
+    return DispatchResult(len(calls) - failed - skipped, fails + failed, calls if timed else None, skipped, done)
+
+
+def _select(handlers: List[Selection], skip: AbstractSet[str] = None,
+            keyed: bool = True) -> List[Tuple[Optional[str], Selection]]:
+    # Pairs handlers with their checkpoint keys, leaving out the ones a replay already saw succeed. Keys are only
+    # named for spooled deliveries
+    if not keyed and not skip:
+        return [(None, selection) for selection in handlers]
+    return [(key, selection) for key, selection in zip(_handler_keys(handlers), handlers)
+            if not skip or key not in skip]
+
+
+def _on_retried(func, key: str, retried: Optional[Callable[[str], None]]) -> Optional[Callable[[], None]]:
+    # Only handlers whose policy retries in the background report back, with their checkpoint key
+    if retried is None or not isinstance(func, PolicyHandler) or not func.retries:
+        return None
+    return partial(retried, key)
+
+
+def _run_handlers(handlers: List[Selection], data: dict, timed: bool = False, fanout: Executor = None,
+                  deliveries: List[str] = None, retried: Callable[[str], None] = None,
+                  skip: AbstractSet[str] = None, keyed: bool = False) -> DispatchResult:
+    selected = _select(handlers, skip, keyed)
+    instances = _build_events([selection for _, selection in selected], data, deliveries)
+    fails = 0
+    calls = []
+    keys = []
+    for _, group in groupby(selected, key=lambda pair: pair[1].priority):
+        runnable = []
+        for key, selection in group:
+            instance = instances[selection.event]
+            if instance is None:
+                fails += 1
+            else:
+                runnable.append((key, selection.call, instance))
+
+        keys.extend(key for key, _, _ in runnable)
+        if fanout is None or len(runnable) < 2:
+            calls.extend(_call_handler(func, instance, timed, _on_retried(func, key, retried))
+                         for key, func, instance in runnable)
+        else:
+            # Handlers sharing a priority run concurrently, the next priority waits for all of them
+            futures = [fanout.submit(_call_handler, func, instance, timed, _on_retried(func, key, retried))
+                       for key, func, instance in runnable]
+            calls.extend(future.result() for future in futures)
+
+    return _tally(calls, keys, fails, timed)
+
+
+def _response(result: DispatchResult) -> Tuple[str, int]:
+    if result.count == 0 and result.fails == 0 and result.skipped == 0:
+        return "No event was found", 204
+
+    message = f"Executed {result.count} methods"
+    if result.skipped:
+        message += f", skipped {result.skipped} with an open circuit"
+    if result.fails:
+        message += f" but failed to execute {result.fails} methods"
+    return message, 200
+
+
+_CHUNK_SIZE = 64 * 1024
+_SPOOLED_HEADERS = ("X-Github-Event", "X-GitHub-Delivery", "content-type")
+
+
+class _SignedBody:
+    def __init__(self, secret: Optional[bytes], algorithm: Optional[str], signature: Optional[str],
+                 max_size: Optional[int]):
+        self._digest = hmac.new(secret, digestmod=algorithm) if secret else None
+        self._algorithm = algorithm
+        self._signature = signature
+        self._max_size = max_size
+        self._body = bytearray()
+
+    def update(self, chunk: bytes):
+        if self._max_size is not None and len(self._body) + len(chunk) > self._max_size:
+            abort(413, "Payload is too large")
+
+        self._body += chunk
+        if self._digest is not None:
+            self._digest.update(chunk)
+
+    def finish(self) -> bytearray:
+        if self._digest is not None:
+            sig_parts = self._signature.split("=", 1)
+            if len(sig_parts) < 2 or sig_parts[0] != self._algorithm or \
+                    not hmac.compare_digest(sig_parts[1], self._digest.hexdigest()):
+                abort(400, "Invalid signature")
+
+        return self._body
+
+
 class EventHook:
-    def __init__(self, webhook: Webhook, endpoint: str, secret=None):
+    def __init__(self, webhook: Webhook, endpoint: str, secret=None, dispatcher: Dispatcher = None,
+                 dedup: DeliveryCache = None, max_body_size: int = None, lazy: bool = None, fanout: Executor = None):
         self._webhook = webhook
-        self._events = {}
-        self._secret = secret
+        self._fanout = fanout if fanout is not None else webhook.fanout
+        self._spool = webhook.spool
+        self._metrics = webhook.metrics
+        self._coalescer = webhook.coalescer
+        self._lazy = lazy if lazy is not None else webhook.lazy
+        self._max_body_size = max_body_size if max_body_size is not None else webhook.max_body_size
+        self._dispatcher = dispatcher if dispatcher is not None else webhook.dispatcher
+        self._dedup = dedup if dedup is not None else webhook.dedup
+        # X-Github-Event header value -> handlers of that event
+        self._events: Dict[str, HandlerIndex] = {}
+        self._endpoint = endpoint
+        self.secret = secret
 
+        self._webhook._register(self)
         self._webhook.app.add_url_rule(endpoint, endpoint, self._post_recieve, methods=['POST'])
 
+    @property
+    def webhook(self) -> Webhook:
+        return self._webhook
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    @property
+    def dispatcher(self) -> Optional[Dispatcher]:
+        return self._dispatcher
+
+    @property
+    def dedup(self) -> Optional[DeliveryCache]:
+        return self._dedup
+
+    @property
+    def metrics(self) -> Optional[MetricsSink]:
+        return self._metrics
+
+    @property
+    def spool(self) -> Optional[Spool]:
+        return self._spool
+
+    @property
+    def breakers(self) -> Dict[str, CircuitBreaker]:
+        # "endpoint:event:handler" -> breaker of every handler registered with a breaker policy
+        return {
+            f"{self._endpoint}:{name}:{_handler_name(handler.func)}": handler.call.breaker
+            for name, index in self._events.items() for handler in index
+            if isinstance(handler.call, PolicyHandler) and handler.call.breaker is not None
+        }
+
     @property
     def secret(self):
         return self._secret
 
     @secret.setter
     def secret(self, secret):
-        if secret is not None and not isinstance(secret, six.binary_type):
-            secret = secret.encode("utf-8")
-        self._secret = secret
+        self._secret = _encode_secret(secret)
 
-    def add_event(self, func, event_type: Type[Event]):
-        self._events.setdefault(event_type, [])
-        self._events.get(event_type).append(func)
+    def add_event(self, func, event_type: Type[Event], hook_filter: HookFilter = None, policy: HandlerPolicy = None,
+                  priority: int = 0):
+        index = self._events.setdefault(_event_name(event_type), HandlerIndex())
+        index.add(func, event_type, hook_filter, policy, priority)
 
-    def _get_header(self, key):
+    def remove_event(self, func, event_type: Type[Event]):
+        name = _event_name(event_type)
+        index = self._events.get(name)
+        if index is not None:
+            index.remove(func, event_type)
+            if not index:
+                del self._events[name]
+
+    def handlers(self, event_type: str, data: dict) -> List[Selection]:
+        index = self._events.get(event_type)
+        if index is None:
+            return []
+
+        # Filters run on the raw payload, the result is a fresh mapping so later registrations
+        # don't race with a running dispatch
+        selected = index.select(data)
+        if self._lazy:
+            return [selection._replace(event=selection.event.lazy_class()) for selection in selected]
+        return selected
+
+    @staticmethod
+    def _get_header(headers, key):
         try:
-            return request.headers[key]
+            return headers[key]
         except KeyError:
             abort(400, "Missing header: " + key)
 
-    def _validate_secret(self):
-        digest = hmac.new(self._secret, request.data, hashlib.sha1).hexdigest() if self._secret else None
+    def _body_reader(self, headers) -> '_SignedBody':
+        # Fail on missing headers before any of the body is read
+        self._get_header(headers, "X-Github-Event")
+        self._get_header(headers, "content-type")
 
-        if digest is not None:
-            sig_parts = self._get_header("X-Hub-Signature").split("=", 1)
-            if not isinstance(digest, six.text_type):
-                digest = six.text_type(digest)
+        if self._max_body_size is not None:
+            length = headers.get("content-length")
+            if length is not None and length.isdigit() and int(length) > self._max_body_size:
+                abort(413, "Payload is too large")
 
-            if len(sig_parts) < 2 or sig_parts[0] != "sha1" or not hmac.compare_digest(sig_parts[1], digest):
-                abort(400, "Invalid signature")
+        signature = None
+        algorithm = None
+        if self._secret:
+            for header, algorithm in (("X-Hub-Signature-256", "sha256"), ("X-Hub-Signature", "sha1")):
+                signature = headers.get(header)
+                if signature is not None:
+                    break
+            else:
+                self._count(metrics.SIGNATURE_FAILURES)
+                abort(400, "Missing header: X-Hub-Signature-256")
 
-    def _post_recieve(self):
-        event_type = self._get_header("X-Github-Event")
-        content_type = self._get_header("content-type")
-        data = (
-            json.loads(request.form.to_dict()["payload"])
-            if content_type == "application/x-www-form-urlencoded"
-            else request.get_json()
-        )
+        return _SignedBody(self._secret, algorithm, signature, self._max_body_size)
+
+    def _prepare(self, headers, body: bytes) -> Optional[Tuple[str, dict]]:
+        # Shared by the Flask view and the ASGI front end, expects a body verified by _body_reader.
+        # Aborts with an HTTPException on bad input and returns None for deliveries that were already received
+        event_type = self._get_header(headers, "X-Github-Event")
+        content_type = self._get_header(headers, "content-type")
+
+        delivery = headers.get("X-GitHub-Delivery")
+        if self._dedup is not None and delivery and self._dedup.seen(delivery):
+            self._count(metrics.DEDUP_HITS)
+            return None
+
+        if self._metrics is not None:
+            self._metrics.increment(metrics.DELIVERIES, {"endpoint": self._endpoint, "event": event_type})
+            self._metrics.observe(metrics.DELIVERY_BYTES, {"endpoint": self._endpoint}, len(body))
+
+        try:
+            return event_type, self._decode(content_type, body)
+        except HTTPException:
+            self._forget(headers)
+            raise
+
+    def _forget(self, headers):
+        # Undoes the dedup record of a delivery that is turned away, github redelivers it with the same id
+        delivery = headers.get("X-GitHub-Delivery")
+        if self._dedup is not None and delivery:
+            self._dedup.discard(delivery)
+
+    def _count(self, name: str):
+        if self._metrics is not None:
+            self._metrics.increment(name, {"endpoint": self._endpoint})
+
+    def _finish(self, reader: '_SignedBody') -> bytearray:
+        try:
+            return reader.finish()
+        except HTTPException:
+            self._count(metrics.SIGNATURE_FAILURES)
+            raise
+
+    def _decode(self, content_type: str, body: bytes) -> dict:
+        try:
+            data = (
+                self._webhook.codec.loads(parse_qs(body.decode("utf-8"))["payload"][0])
+                if content_type == "application/x-www-form-urlencoded"
+                else self._webhook.codec.loads(body)
+            )
+        except (KeyError, ValueError):
+            data = None
 
         if data is None:
             abort(400, "Request body must contain json")
+        # Filters, coalescing and partitioning read the payload as a mapping
+        if not isinstance(data, dict):
+            abort(400, "Request body must contain a json object")
+
+        return data
+
+    def _admit(self, headers, handlers: List[Selection]):
+        # Back-pressure from batch handlers, github redelivers what is turned away
+        if any(isinstance(selection.call, BatchHandler) and selection.call.full for selection in handlers):
+            self._forget(headers)
+            self._count(metrics.REJECTED)
+            abort(503, "Batch buffer is full")
+
+    def _spool_delivery(self, headers, body: bytes) -> Optional[int]:
+        if self._spool is None:
+            return None
+        kept = {key: headers[key] for key in _SPOOLED_HEADERS if key in headers}
+        return self._spool.append(self._endpoint, kept, bytes(body))
 
-        count = 0
-        fails = 0
-        for event in self._events.keys():
-            if event.__name__.lower() == event_type + '_event':
-                for func in self._events.get(event, []):
-                    try:
-                        func(event(data))
-                        count += 1
-                    except Exception:
-                        fails += 1
-
-        if count == 0:
+    def _complete(self, entry: Optional[int], event_type: str, result: DispatchResult):
+        if result.timings is not None:
+            for name, seconds, succeeded in result.timings:
+                labels = {"endpoint": self._endpoint, "event": event_type, "handler": name}
+                self._metrics.observe(metrics.HANDLER_SECONDS, labels, seconds)
+                outcome = "skipped" if succeeded is None else "success" if succeeded else "failure"
+                self._metrics.increment(metrics.HANDLER_CALLS, {**labels, "outcome": outcome})
+
+        if entry is not None:
+            if result.fails == 0:
+                self._spool.ack(entry)
+            elif result.done:
+                # A replay then only runs the handlers that failed
+                self._spool.checkpoint(entry, result.done)
+
+    def _retried_for(self, entry: Optional[int], handlers: List[Selection]) -> Optional[Callable[[str], None]]:
+        # A background retry that succeeds checkpoints its handler, so a replay after a restart doesn't run it
+        # again. None when nothing is spooled or no handler retries (process pools can't take the bound method)
+        if entry is None or not any(isinstance(selection.call, PolicyHandler) and selection.call.retries
+                                    for selection in handlers):
+            return None
+        return partial(self._retried, entry)
+
+    def _retried(self, entry: int, key: str):
+        self._spool.checkpoint(entry, (key,))
+
+    def _replay(self, entry: int, headers: Dict[str, str], body: bytes) -> Optional[DispatchResult]:
+        try:
+            event_type = self._get_header(headers, "X-Github-Event")
+            data = self._decode(self._get_header(headers, "content-type"), body)
+        except HTTPException:
+            self._webhook.logger.warning(f"Dropping unreadable spooled delivery {entry} of {self._endpoint}")
+            self._spool.ack(entry)
+            return None
+
+        handlers = self.handlers(event_type, data)
+        result = _run_handlers(handlers, data, self._metrics is not None, self._fanout,
+                               retried=self._retried_for(entry, handlers), skip=self._spool.completed(entry),
+                               keyed=True)
+        self._complete(entry, event_type, result)
+        return result
+
+    def _post_recieve(self):
+        reader = self._body_reader(request.headers)
+        for chunk in iter(lambda: request.stream.read(_CHUNK_SIZE), b""):
+            reader.update(chunk)
+
+        body = self._finish(reader)
+        prepared = self._prepare(request.headers, body)
+        if prepared is None:
+            return "Delivery was already received", 200
+        event_type, data = prepared
+
+        handlers = self.handlers(event_type, data)
+        if not handlers:
             return "No event was found", 204
-        else:
-            message = f"Executed {count} methods" + "" if fails == 0 else f" but failed to execute {fails} methods"
-            return message, 200
+        self._admit(request.headers, handlers)
+
+        # Spooled before acknowledging so a crash in between is replayed by Webhook.recover
+        entry = self._spool_delivery(request.headers, body)
+
+        if self._coalescer is not None:
+            key = self._coalescer.key(event_type, data)
+            if key is not None:
+                self._coalesce(key, request.headers.get("X-GitHub-Delivery"), (entry, event_type, handlers, data))
+                return "Delivery accepted", 202
+
+        if self._dispatcher is not None:
+            if not self._submit(entry, event_type, handlers, data):
+                if entry is not None:
+                    self._spool.ack(entry)
+                self._forget(request.headers)
+                self._count(metrics.REJECTED)
+                abort(503, "Dispatch queue is full")
+            return "Delivery accepted", 202
+
+        result = _run_handlers(handlers, data, self._metrics is not None, self._fanout,
+                               retried=self._retried_for(entry, handlers), keyed=entry is not None)
+        self._complete(entry, event_type, result)
+        return _response(result)
+
+    def _submit(self, entry: Optional[int], event_type: str, handlers: List[Selection], data: dict,
+                deliveries: List[str] = None, block: bool = False) -> bool:
+        timed = self._metrics is not None
+        callback = None if entry is None and not timed else partial(self._complete, entry, event_type)
+        return self._dispatcher.submit(_run_handlers, handlers, data, timed, self._fanout, deliveries,
+                                       self._retried_for(entry, handlers), None, entry is not None,
+                                       callback=callback, key=self._dispatcher.partition_key(data), block=block)
+
+    def _coalesce(self, key, delivery: Optional[str], item: tuple):
+        # The coalescer is shared by every hook of the webhook, a push to another endpoint must not replace this one
+        superseded = self._coalescer.offer((self._endpoint, key), delivery, item, self._flush_coalesced)
+        if superseded is not None:
+            # Dropped for good, the newer delivery stands in for it
+            self._count(metrics.COALESCED)
+            if superseded[0] is not None:
+                self._spool.ack(superseded[0])
+
+    def _flush_coalesced(self, item: tuple, deliveries: List[str]):
+        entry, event_type, handlers, data = item
+        # Github was answered long ago, so a full dispatcher is waited on rather than the delivery dropped.
+        # That holds up only the coalescer's own thread
+        if self._dispatcher is None or not self._submit(entry, event_type, handlers, data, deliveries, block=True):
+            result = _run_handlers(handlers, data, self._metrics is not None, self._fanout, deliveries,
+                                   self._retried_for(entry, handlers), keyed=entry is not None)
+            self._complete(entry, event_type, result)
@@ -0,0 +1,151 @@
+import asyncio
+import inspect
+import time
+from concurrent.futures import Executor
+from itertools import groupby
+from typing import Callable, Dict, List, Tuple, Optional
+
+from werkzeug.datastructures import Headers
+from werkzeug.exceptions import HTTPException
+
+from GitHook.api import Webhook, EventHook, DispatchResult, _build_events, _handler_name, _logger, _on_retried, \
+    _response, _select, _tally
+from GitHook.events import Event
+from GitHook.filters import Selection
+from GitHook.policy import CircuitOpenError
+
+
+async def _call_handler(func, instance: Event, timeout: Optional[float], executor: Optional[Executor],
+                        timed: bool = False,
+                        retried: Callable[[], None] = None) -> Tuple[Optional[str], float, Optional[bool]]:
+    started = time.perf_counter() if timed else 0.0
+    if inspect.iscoroutinefunction(func):
+        awaitable = func(instance)
+    else:
+        # Sync handlers are offloaded so they never block the event loop
+        args = (instance,) if retried is None else (instance, retried)
+        awaitable = asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    try:
+        if timeout is None:
+            await awaitable
+        else:
+            await asyncio.wait_for(awaitable, timeout)
+        succeeded = True
+    except CircuitOpenError:
+        _logger.info(f"Skipped handler {_handler_name(func)}, its circuit is open")
+        succeeded = None
+    except Exception:
+        _logger.exception(f"Handler {_handler_name(func)} failed")
+        succeeded = False
+    if not timed:
+        return None, 0.0, succeeded
+    return _handler_name(func), time.perf_counter() - started, succeeded
+
+
+async def run_handlers_async(handlers: List[Selection], data: dict, timeout: float = None,
+                             executor: Executor = None, timed: bool = False,
+                             retried: Callable[[str], None] = None, keyed: bool = False) -> DispatchResult:
+    selected = _select(handlers, keyed=keyed)
+    instances = _build_events([selection for _, selection in selected], data)
+    fails = 0
+    calls = []
+    keys = []
+    for _, group in groupby(selected, key=lambda pair: pair[1].priority):
+        runnable = []
+        for key, selection in group:
+            instance = instances[selection.event]
+            if instance is None:
+                fails += 1
+            else:
+                keys.append(key)
+                runnable.append(_call_handler(selection.call, instance, timeout, executor, timed,
+                                              _on_retried(selection.call, key, retried)))
+        calls.extend(await asyncio.gather(*runnable))
+
+    return _tally(calls, keys, fails, timed)
+
+
+class AsgiApp:
+    def __init__(self, hooks: List[EventHook], timeout: float = None, executor: Executor = None):
+        self._hooks: Dict[str, EventHook] = {hook.endpoint: hook for hook in hooks}
+        # Shut down with the app so their buffers, coalescer and spool are flushed
+        self._webhooks: List[Webhook] = list({id(hook.webhook): hook.webhook for hook in hooks}.values())
+        self._timeout = timeout
+        self._executor = executor
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            body, status = await self._handle(scope, receive)
+            await send({'type': 'http.response.start', 'status': status,
+                        'headers': [(b'content-type', b'text/plain; charset=utf-8')]})
+            await send({'type': 'http.response.body', 'body': body.encode('utf-8')})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True)
+                # After the executor, events its last handlers buffered are flushed too
+                for webhook in self._webhooks:
+                    webhook.shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _handle(self, scope, receive) -> Tuple[str, int]:
+        hook = self._hooks.get(scope['path'])
+        if hook is None:
+            return 'Not Found', 404
+        if scope['method'] != 'POST':
+            return 'Method Not Allowed', 405
+
+        headers = Headers([(key.decode('latin-1'), value.decode('latin-1')) for key, value in scope['headers']])
+        try:
+            reader = hook._body_reader(headers)
+            while True:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    return 'Client disconnected', 400
+                reader.update(message.get('body', b''))
+                if not message.get('more_body', False):
+                    break
+
+            body = hook._finish(reader)
+            prepared = hook._prepare(headers, body)
+        except HTTPException as e:
+            return e.description, e.code
+
+        if prepared is None:
+            return 'Delivery was already received', 200
+        event_type, data = prepared
+
+        handlers = hook.handlers(event_type, data)
+        if not handlers:
+            return 'No event was found', 204
+        try:
+            hook._admit(headers, handlers)
+        except HTTPException as e:
+            return e.description, e.code
+
+        # Spool writes block on sqlite (and on the group commit with batch_size > 1), they run in the loop's
+        # default executor so other deliveries keep going and can fill the batch
+        loop = asyncio.get_running_loop()
+        entry = None
+        if hook.spool is not None:
+            entry = await loop.run_in_executor(None, hook._spool_delivery, headers, body)
+        result = await run_handlers_async(handlers, data, self._timeout, self._executor, hook.metrics is not None,
+                                          hook._retried_for(entry, handlers), entry is not None)
+        if entry is None:
+            hook._complete(entry, event_type, result)
+        else:
+            await loop.run_in_executor(None, hook._complete, entry, event_type, result)
+        return _response(result)
+
+
+def create_asgi_app(*hooks: EventHook, timeout: float = None, executor: Executor = None) -> AsgiApp:
+    return AsgiApp(list(hooks), timeout, executor)
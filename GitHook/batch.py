@@ -0,0 +1,100 @@
+import functools
+import logging
+import threading
+import time
+from typing import Callable, List
+
+from GitHook.policy import _call
+
+_logger = logging.getLogger("webhook")
+
+
+class BatchHandler:
+    # Buffers events and hands them to func as lists, once size of them are waiting or the oldest has waited
+    # interval seconds. Deliveries are turned away while capacity events are buffered
+    def __init__(self, func: Callable[[list], None], size: int = 100, interval: float = 1.0, capacity: int = 1000):
+        assert size > 0, 'size must be positive'
+        assert interval > 0, 'interval must be positive'
+        assert capacity >= size, 'capacity can not be smaller than size'
+        self._func = func
+        self._size = size
+        self._interval = interval
+        self._capacity = capacity
+        self._events = []
+        # Arrival time of each buffered event, the first one decides when the interval is up
+        self._arrivals: List[float] = []
+        self._condition = threading.Condition()
+        # Held while a batch is handed over, keeps batches in order and the function single threaded
+        self._delivering = threading.Lock()
+        self._thread = None
+        functools.update_wrapper(self, func)
+
+    def __call__(self, event):
+        with self._condition:
+            if len(self._events) >= self._capacity:
+                raise BufferError(f'Batch buffer of {self.__qualname__} is full')
+            self._events.append(event)
+            self._arrivals.append(time.monotonic())
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='githook-batch', daemon=True)
+                self._thread.start()
+            if len(self._events) == 1 or len(self._events) >= self._size:
+                self._condition.notify()
+
+    def _ready(self) -> bool:
+        return len(self._events) >= self._size or \
+            bool(self._arrivals) and time.monotonic() >= self._arrivals[0] + self._interval
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._ready():
+                    arrivals = self._arrivals
+                    self._condition.wait(arrivals[0] + self._interval - time.monotonic() if arrivals else None)
+
+            with self._delivering:
+                with self._condition:
+                    batch = self._events[:self._size]
+                    del self._events[:self._size]
+                    del self._arrivals[:self._size]
+                if batch:
+                    self._deliver(batch)
+
+    def _deliver(self, batch: list):
+        try:
+            _call(self._func, batch)
+        except Exception:
+            _logger.exception(f'Batch handler {self.__qualname__} failed on {len(batch)} events')
+
+    def flush(self):
+        # Hands over everything buffered and returns once the function has seen it
+        with self._delivering:
+            with self._condition:
+                events, self._events = self._events, []
+                self._arrivals = []
+            for start in range(0, len(events), self._size):
+                self._deliver(events[start:start + self._size])
+
+    def __len__(self):
+        return len(self._events)
+
+    @property
+    def full(self) -> bool:
+        return len(self._events) >= self._capacity
+
+    @property
+    def func(self) -> Callable[[List], None]:
+        return self._func
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
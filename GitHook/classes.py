@@ -1,18 +1,90 @@
+import copyreg
 import re
-from datetime import datetime
-from typing import Tuple, Dict, Optional, Any, Iterable
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Tuple, Dict, Optional, Any, Iterable, Union, get_args, get_origin, get_type_hints
+
+
+_PLACEHOLDER = re.compile("{(.+?)}")
+_MISSING = object()
+
+
+class _Template:
+    __slots__ = ('_prefix', '_segments')
+
+    def __init__(self, https: bool, url: str, args: Tuple[str, ...]):
+        literals = [('https://' if https else 'http://') + url]
+        segments = []
+        for arg in args:
+            tokens = []
+            position = 0
+            for match in _PLACEHOLDER.finditer(arg):
+                if match.start() > position:
+                    tokens.append(arg[position:match.start()])
+                holder = match.group(1)
+                # (name, optional) for placeholders, optional ones are written as {/name}
+                tokens.append((holder[1:], True) if holder.startswith('/') else (holder, False))
+                position = match.end()
+            if position < len(arg):
+                tokens.append(arg[position:])
+
+            literal = _PLACEHOLDER.sub('', arg)
+            assert literal.find('/') == -1 and literal.find('\\') == -1, 'arguments can not have "/" or "\\" in them'
+
+            if len(tokens) == 1 and isinstance(tokens[0], str):
+                tokens = tokens[0]
+            elif not tokens:
+                continue
+
+            # Literal segments ahead of the first placeholder are folded into the prefix
+            if isinstance(tokens, str) and not segments:
+                literals.append(tokens)
+            else:
+                segments.append(tokens if isinstance(tokens, str) else tuple(tokens))
+
+        self._prefix = '/'.join(literals)
+        self._segments = tuple(segments)
+
+    def render(self, args: dict) -> str:
+        if not self._segments:
+            return self._prefix
+
+        parts = [self._prefix]
+        for tokens in self._segments:
+            if isinstance(tokens, str):
+                parts.append(tokens)
+                continue
+
+            segment = ''.join(token if isinstance(token, str) else self._value(token, args) for token in tokens)
+            if segment:
+                parts.append(segment)
+
+        return '/'.join(parts)
+
+    @staticmethod
+    def _value(token: Tuple[str, bool], args: dict) -> str:
+        holder, optional = token
+        if holder in args:
+            return str(args[holder])
+        if optional:
+            return ''
+        raise KeyError(f'url requires an argument named "{holder}" to be created')
+
+
+@lru_cache(maxsize=4096)
+def _template(https: bool, url: str, args: Tuple[str, ...]) -> _Template:
+    return _Template(https, url, args)
 
 
 class URL:
     @staticmethod
     def from_str(url: str) -> 'URL':
-        url = url.replace("\\", "/")
-
         assert url is not None, 'url must be provided'
+        url = url.replace("\\", "/")
         assert url.startswith("https://") or url.startswith('http://'), 'invalid url format'
 
         https = url.startswith("https://")
-        url_parts = url[7 + 1 if https else 0:].split('/')
+        url_parts = url[8 if https else 7:].split('/')
 
         url = url_parts[0]
         args = tuple(url_parts[1:])
@@ -22,44 +94,15 @@ class URL:
     def __init__(self, https: bool = True, url: str = None, args: Iterable[str] = None):
         assert url is not None, 'url must be provided'
         assert url.find('/') == -1 and url.find('\\') == -1, 'url can not have "/" or "\\" in it'
-        args = [] if args is None else args
-        for arg in args:
-            placeholders = re.findall("{(.+?)}", arg)
-            for placeholder in placeholders:
-                arg = arg.replace(f'{{{placeholder}}}', 'HOLDER_HERE')
-
-            assert arg.find('/') == -1 and arg.find('\\') == -1, 'arguments can not have "/" or "\\" in them'
+        args = () if args is None else tuple(args)
 
         self._https = https
         self._url = url
         self._args = args
+        self._template = _template(https, url, args)
 
     def get_url(self, **args):
-        url = ('https://' if self._https else 'http://') + self._url
-
-        for arg in self._args:
-            placeholders = re.findall("{(.+?)}", arg)
-            for holder in placeholders:
-                if holder.startswith('/'):
-                    holder = holder[1:]
-                    value = ''
-                    if holder in args:
-                        value = args.get(holder)
-
-                    arg = arg.replace(f'{{/{holder}}}', value)
-                else:
-                    value = ''
-                    if holder in args:
-                        value = args.get(holder)
-                    else:
-                        raise KeyError(f'url requires an argument named "{holder}" to be created')
-
-                    arg = arg.replace(f'{{{holder}}}', value)
-
-            if arg:
-                url += '/' + arg
-
-        return url
+        return self._template.render(args)
 
     def add_args(self, *args):
         return URL(https=self._https, url=self._url, args=(*self._args, *args))
@@ -72,10 +115,249 @@ class URL:
         return ('https://' if self._https else 'http://') + self._url + (f'/{args}' if args else '')
 
 
-class DataHolder:
+_EPOCH = datetime.fromtimestamp(0, timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(time: str) -> datetime:
+    # fromisoformat only learned to read the "Z" suffix in python 3.11
+    if time[-1] in 'Zz':
+        time = time[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(time)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_timestamp(time) -> datetime:
+    # GitHub sends ISO-8601 strings in most payloads but epoch seconds in some (e.g. push repositories)
+    if time is None or time == '':
+        return _EPOCH
+    if isinstance(time, datetime):
+        return time if time.tzinfo is not None else time.replace(tzinfo=timezone.utc)
+    if isinstance(time, (int, float)):
+        return datetime.fromtimestamp(time, timezone.utc)
+    if time.isdigit():
+        return datetime.fromtimestamp(int(time), timezone.utc)
+    return _parse_iso_timestamp(time)
+
+
+class memoized:
+    # Like property, but the value is computed once per instance and kept in the holder's cache
+    def __init__(self, func):
+        self._func = func
+        self._name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    @staticmethod
+    def _cache_of(instance) -> dict:
+        try:
+            return instance._cache
+        except AttributeError:
+            # Created on first use so holders that are never asked for derived values stay small
+            cache = {}
+            object.__setattr__(instance, '_cache', cache)
+            return cache
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        cache = self._cache_of(instance)
+        try:
+            return cache[self._name]
+        except KeyError:
+            value = cache[self._name] = self._func(instance)
+            return value
+
+    @property
+    def func(self):
+        return self._func
+
+    def seed(self, instance, value):
+        # Presets the value, for what is known about a holder but is not part of its payload
+        self._cache_of(instance)[self._name] = value
+
+
+class _HolderMeta(type):
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        # Every holder is slotted so neither the full nor the compact representation carries a __dict__
+        namespace.setdefault('__slots__', ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+def _nested_holders(base: type) -> Dict[str, Tuple[type, bool]]:
+    # field -> (holder, is list) for the memoized accessors that wrap nested holders, read from their annotations.
+    # Holders without declared fields (e.g. Installation) would drop their payload and are left out
+    nested = {}
+    seen = set()
+    for klass in base.__mro__:
+        for name, value in vars(klass).items():
+            if name in seen or name.startswith('_'):
+                continue
+            seen.add(name)
+            if not isinstance(value, memoized):
+                continue
+            try:
+                hint = get_type_hints(value.func).get('return')
+            except NameError:
+                continue
+
+            if get_origin(hint) is Union:
+                args = [arg for arg in get_args(hint) if arg is not type(None)]
+                hint = args[0] if len(args) == 1 else None
+            many = get_origin(hint) is list
+            if many:
+                hint = get_args(hint)[0]
+            if isinstance(hint, type) and issubclass(hint, DataHolder) and hint.fields():
+                nested[name] = (hint, many)
+    return nested
+
+
+def _compacted(value, holder: type, many: bool):
+    compact = holder.compact_class()
+    if many:
+        return tuple(item if isinstance(item, holder) else compact(item) for item in value)
+    return value if isinstance(value, holder) else compact(value)
+
+
+class _Compact:
+    __slots__ = ()
+    _slot_of: Dict[str, Any] = {}
+    _nested_of: Dict[str, Tuple[type, bool]] = {}
+
+    def __init__(self, data: dict, keep: list = None):
+        for key in self._required_keys:
+            if key not in data:
+                raise ValueError(f'Data is missing required key: "{key}"')
+
+        optional = self._optional_keys
+        nested = self._nested_of
+        for key, slot in self._slot_of.items():
+            if key in data:
+                value = data[key]
+                # Nested objects are kept compact too, not as the raw payload they came in
+                if value and key in nested:
+                    value = _compacted(value, *nested[key])
+                slot.__set__(self, value)
+            elif key in optional:
+                slot.__set__(self, optional[key])
+
+    def get(self, key, default=None):
+        slot = self._slot_of.get(key)
+        if slot is None:
+            return default
+        try:
+            return slot.__get__(self, type(self))
+        except AttributeError:
+            return default
+
+    def compact(self):
+        return self
+
+    def _wrap(self, holder: type, data):
+        # Already compacted when the payload was taken in
+        if isinstance(data, holder):
+            return data
+        return holder.compact_class()(data)
+
+    def __reduce__(self):
+        data = {}
+        for key in self._slot_of:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                data[key] = value
+        return type(self), (data,)
+
+
+class _Lazy:
+    # Keeps a reference to the decoded payload instead of a defaulted copy, nested holders stay lazy too
+    __slots__ = ()
+
+    def __init__(self, data: dict, keep: list = None):
+        for key in self._required_keys:
+            if key not in data:
+                raise ValueError(f'Data is missing required key: "{key}"')
+
+        object.__setattr__(self, '_data', data)
+
+    def get(self, key, default=None):
+        data = self._data
+        if key in data:
+            return data[key]
+        return self._optional_keys.get(key, default)
+
+    def _wrap(self, holder: type, data: dict):
+        return holder.lazy_class()(data)
+
+
+_MIXINS = {'compact': _Compact, 'lazy': _Lazy}
+_derived: Dict[Tuple[type, str], type] = {}
+
+
+def _derived_class(base: type, kind: str) -> type:
+    derived = _derived.get((base, kind))
+    if derived is None:
+        namespace = {
+            '__module__': base.__module__,
+            '__qualname__': f'{base.__qualname__}.{kind}_class()',
+            '_base_class': base,
+            '_kind': kind,
+        }
+        if kind == 'compact':
+            fields = base.fields()
+            # Slot names are prefixed so they don't shadow the properties of the same name
+            namespace['__slots__'] = tuple(f'_f_{field}' for field in fields)
+
+        derived = type(base)(f'{kind.capitalize()}{base.__name__}', (_MIXINS[kind], base), namespace)
+        if kind == 'compact':
+            type.__setattr__(derived, '_slot_of', {field: derived.__dict__[f'_f_{field}'] for field in fields})
+            type.__setattr__(derived, '_nested_of', _nested_holders(base))
+        derived = _derived.setdefault((base, kind), derived)
+    return derived
+
+
+def _reduce_holder_class(cls: type):
+    # Derived classes can't be found by name, pickle them as a rebuild of their base instead
+    base = cls.__dict__.get('_base_class')
+    if base is None:
+        return cls.__qualname__
+    return _derived_class, (base, cls._kind)
+
+
+copyreg.pickle(_HolderMeta, _reduce_holder_class)
+
+
+class DataHolder(metaclass=_HolderMeta):
+    __slots__ = ('_data', '_cache')
     _required_keys: Tuple[str] = ()
     _optional_keys: Dict[str, Optional[Any]] = {}
 
+    @classmethod
+    def fields(cls) -> Tuple[str, ...]:
+        fields = dict.fromkeys(cls._required_keys)
+        fields.update(dict.fromkeys(cls._optional_keys))
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, (property, memoized)) and not name.startswith('_'):
+                    fields[name] = None
+        return tuple(fields)
+
+    @classmethod
+    def compact_class(cls) -> type:
+        return _derived_class(cls.__dict__.get('_base_class', cls), 'compact')
+
+    @classmethod
+    def lazy_class(cls) -> type:
+        return _derived_class(cls.__dict__.get('_base_class', cls), 'lazy')
+
+    def compact(self):
+        return self.compact_class()(self._data)
+
+    def _wrap(self, holder: type, data: dict):
+        return holder(data)
+
     def analyse_data(self, data: dict, keep: list):
         new_data = data.copy()
 
@@ -90,16 +372,29 @@ class DataHolder:
         return new_data
 
     def __init__(self, data: dict, keep: list = None):
-        self._data = self.analyse_data(data, keep)
+        object.__setattr__(self, '_data', self.analyse_data(data, keep))
+
+    def __reduce__(self):
+        # Copies and pickles are rebuilt from the payload, restoring slot state would go through __setattr__
+        return type(self), (self._data,)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"'{self.__class__.__name__}' object is read-only")
+
+    def __delattr__(self, item):
+        raise AttributeError(f"'{self.__class__.__name__}' object is read-only")
 
     def get(self, key, default=None):
         return self._data.get(key, default)
 
-    def __getattribute__(self, item):
-        data = self.get(item)
-        if data is None:
-            raise AttributeError(f"type object '{self.__class__.__name__}' has no attribute '{item}'")
-        return data
+    def __getattr__(self, item):
+        # Only reached once the class lookup (declared properties, methods and slots) has failed,
+        # so undeclared payload keys are the sole fallback and nothing here re-enters attribute lookup
+        if not item.startswith('_'):
+            value = self.get(item, _MISSING)
+            if value is not _MISSING:
+                return value
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
 
 
 class Collaborator(DataHolder):
@@ -126,47 +421,47 @@ class Collaborator(DataHolder):
     def gravatar_id(self) -> str:
         return self.get('gravatar_id')
 
-    @property
+    @memoized
     def url(self) -> URL:
         return URL.from_str(f'https://api.github.com/users/{self.login}')
 
-    @property
+    @memoized
     def html_url(self) -> URL:
         return URL.from_str(f'https://github.com/{self.login}')
 
-    @property
+    @memoized
     def followers_url(self) -> URL:
         return self.url.add_args('followers')
 
-    @property
+    @memoized
     def following_url(self) -> URL:
         return self.url.add_args('following', '{/other_user}')
 
-    @property
+    @memoized
     def gists_url(self) -> URL:
         return self.url.add_args('gists', '{/gist_id}')
 
-    @property
+    @memoized
     def starred_url(self) -> URL:
         return self.url.add_args('starred', '{/owner}', '{/repo}')
 
-    @property
+    @memoized
     def subscriptions_url(self) -> URL:
         return self.url.add_args('subscriptions')
 
-    @property
+    @memoized
     def organizations_url(self) -> URL:
         return self.url.add_args('orgs')
 
-    @property
+    @memoized
     def repos_url(self) -> URL:
         return self.url.add_args('repos')
 
-    @property
+    @memoized
     def events_url(self) -> URL:
         return self.url.add_args('events', '{/privacy}')
 
-    @property
+    @memoized
     def received_events_url(self) -> URL:
         return self.url.add_args('received_events')
 
@@ -221,19 +516,19 @@ class Repository(DataHolder):
     def name(self) -> str:
         return self.get('name')
 
-    @property
+    @memoized
     def full_name(self) -> str:
         return f'{self.owner.login}/{self.name}'
 
-    @property
+    @memoized
     def owner(self) -> Collaborator:
-        return self.get('owner')
+        return self._wrap(Collaborator, self.get('owner'))
 
     @property
     def private(self) -> bool:
         return self.get('private')
 
-    @property
+    @memoized
     def html_url(self) -> URL:
         return URL.from_str(f'https://github.com/{self.owner.login}/{self.name}')
 
@@ -245,159 +540,159 @@ class Repository(DataHolder):
     def fork(self) -> bool:
         return self.get('fork')
 
-    @property
+    @memoized
     def url(self) -> URL:
         return URL.from_str(f'https://api.github.com/repos/{self.full_name}')
 
-    @property
+    @memoized
     def archive_url(self) -> URL:
         return self.url.add_args('{archive_format}', '{/ref}')
 
-    @property
+    @memoized
     def assignees_url(self, user=None) -> URL:
         return self.url.add_args('assignees', '{/user}')
 
-    @property
+    @memoized
     def blobs_url(self) -> URL:
         return self.url.add_args('git', 'blobs', '{/sha}')
 
-    @property
+    @memoized
     def branches_url(self) -> URL:
         return self.url.add_args('branches', '{/branch}')
 
-    @property
+    @memoized
     def collaborators_url(self) -> URL:
         return self.url.add_args('collaborators', '{/collaborator}')
 
-    @property
+    @memoized
     def comments_url(self) -> URL:
         return self.url.add_args('comments', '{/number}')
 
-    @property
+    @memoized
     def commits_url(self) -> URL:
-        return self.url.add_args('commits', '/{sha}')
+        return self.url.add_args('commits', '{/sha}')
 
-    @property
+    @memoized
     def compare_url(self) -> URL:
         return self.url.add_args('compare', '{base}...{head}')
 
-    @property
+    @memoized
     def contents_url(self, path=None) -> URL:
         return self.url.add_args('contents', '{/path}')
 
-    @property
+    @memoized
     def contributors_url(self) -> URL:
         return self.url.add_args('contributors')
 
-    @property
+    @memoized
     def deployments_url(self) -> URL:
         return self.url.add_args('deployments')
 
-    @property
+    @memoized
     def downloads_url(self) -> URL:
         return self.url.add_args('downloads')
 
-    @property
+    @memoized
     def events_url(self) -> URL:
         return self.url.add_args('events')
 
-    @property
+    @memoized
     def forks_url(self) -> URL:
         return self.url.add_args('forks')
 
-    @property
+    @memoized
     def git_commits_url(self) -> URL:
         return self.url.add_args('git', 'commits', '{/sha}')
 
-    @property
+    @memoized
     def git_refs_url(self) -> URL:
         return self.url.add_args('git', 'refs', '{/sha}')
 
-    @property
+    @memoized
     def git_tags_url(self) -> URL:
         return self.url.add_args('git', 'tags', '{/sha}')
 
-    @property
+    @memoized
     def git_url(self) -> str:
         return f'git:github.com/{self.owner.login}/{self.name}.git'
 
-    @property
+    @memoized
     def issue_comment_url(self) -> URL:
         return self.issues_url.add_args('comments', '{/number}')
 
-    @property
+    @memoized
     def issue_events_url(self) -> URL:
         return self.issues_url.add_args('events', '{/number}')
 
-    @property
+    @memoized
     def issues_url(self) -> URL:
         return self.url.add_args('issues', '{/number}')
 
-    @property
+    @memoized
     def keys_url(self) -> URL:
         return self.url.add_args('keys', '{/key_id}')
 
-    @property
+    @memoized
     def labels_url(self) -> URL:
         return self.url.add_args('labels', '{/name}')
 
-    @property
+    @memoized
     def languages_url(self) -> URL:
         return self.url.add_args('languages')
 
-    @property
+    @memoized
     def merges_url(self) -> URL:
         return self.url.add_args('merges')
 
-    @property
+    @memoized
     def milestones_url(self) -> URL:
         return self.url.add_args('milestones', '{/number}')
 
-    @property
+    @memoized
     def notifications_url(self) -> URL:
         return self.url.add_args('notifications')
 
-    @property
+    @memoized
     def pulls_url(self) -> URL:
         return self.url.add_args('pulls', '{/number}')
 
-    @property
+    @memoized
     def releases_url(self) -> URL:
         return self.url.add_args('releases', '{/id}')
 
-    @property
+    @memoized
     def ssh_url(self) -> str:
         return f'git@github.com:{self.full_name}.git'
 
-    @property
+    @memoized
     def stargazers_url(self) -> URL:
         return self.url.add_args('stargazers')
 
-    @property
+    @memoized
     def statuses_url(self) -> URL:
         return self.url.add_args('statuses', '{sha}')
 
-    @property
+    @memoized
     def subscribers_url(self) -> URL:
         return self.url.add_args('subscribers')
 
-    @property
+    @memoized
     def subscription_url(self) -> URL:
         return self.url.add_args('subscription')
 
-    @property
+    @memoized
     def tags_url(self) -> URL:
         return self.url.add_args('tags')
 
-    @property
+    @memoized
     def teams_url(self) -> URL:
         return self.url.add_args('teams')
 
-    @property
+    @memoized
     def trees_url(self) -> URL:
         return self.url.add_args('trees', '{/sha}')
 
-    @property
+    @memoized
     def clone_url(self) -> URL:
         return URL.from_str(f'https://github.com/{self.full_name}.git')
 
@@ -405,11 +700,11 @@ class Repository(DataHolder):
     def mirror_url(self) -> str:
         return self.get('mirror_url')
 
-    @property
+    @memoized
     def hooks_url(self) -> URL:
         return self.url.add_args('hooks')
 
-    @property
+    @memoized
     def svn_url(self) -> URL:
         return URL.from_str(f'https://svn.github.com/{self.full_name}')
 
@@ -497,20 +792,17 @@ class Repository(DataHolder):
     def visibility(self) -> str:
         return self.get('visibility')
 
-    @property
+    @memoized
     def pushed_at(self) -> datetime:
-        time = self.get('pushed_at')
-        return datetime.fromisoformat(time) if time else datetime.fromtimestamp(0)
+        return parse_timestamp(self.get('pushed_at'))
 
-    @property
+    @memoized
     def created_at(self) -> datetime:
-        time = self.get('created_at')
-        return datetime.fromisoformat(time[:-1]) if time else datetime.fromtimestamp(0)
+        return parse_timestamp(self.get('created_at'))
 
-    @property
+    @memoized
     def updated_at(self) -> datetime:
-        time = self.get('updated_at')
-        return datetime.fromisoformat(time[:-1]) if time else datetime.fromtimestamp(0)
+        return parse_timestamp(self.get('updated_at'))
 
     @property
     def permissions(self) -> dict:
@@ -520,10 +812,10 @@ class Repository(DataHolder):
     def allow_rebase_merge(self) -> bool:
         return self.get('allow_rebase_merge')
 
-    @property
+    @memoized
     def template_repository(self) -> Optional['Repository']:
         data = self.get('template_repository')
-        return Repository(data, []) if data else None
+        return self._wrap(Repository, data) if data else None
 
     @property
     def temp_clone_token(self) -> str:
@@ -553,25 +845,25 @@ class Repository(DataHolder):
     def network_count(self) -> int:
         return self.get('network_count')
 
-    @property
+    @memoized
     def license(self) -> Optional[Licence]:
         data = self.get('license')
-        return Licence(data, []) if data else None
+        return self._wrap(Licence, data) if data else None
 
-    @property
+    @memoized
     def organization(self) -> Optional[Collaborator]:
         data = self.get('organization')
-        return Collaborator(data, []) if data else None
+        return self._wrap(Collaborator, data) if data else None
 
-    @property
+    @memoized
     def parent(self) -> Optional['Repository']:
         data = self.get('parent')
-        return Repository(data, []) if data else None
+        return self._wrap(Repository, data) if data else None
 
-    @property
+    @memoized
     def source(self) -> Optional['Repository']:
         data = self.get('source')
-        return Repository(data, []) if data else None
+        return self._wrap(Repository, data) if data else None
 
 
 '''
@@ -601,9 +893,9 @@ class Release(DataHolder):
     def node_id(self) -> str:
         return self.get('node_id')
 
-    @property
+    @memoized
     def author(self) -> Collaborator:
-        return Collaborator(self.get('author'))
+        return self._wrap(Collaborator, self.get('author'))
 
     @property
     def tag_name(self) -> str:
@@ -629,15 +921,62 @@ class Release(DataHolder):
     def assets(self) -> list:
         return self.get('assets')
 
-    @property
+    @memoized
     def created_at(self) -> datetime:
-        time = self.get('created_at')
-        return datetime.fromisoformat(time[:-1]) if time else datetime.fromtimestamp(0)
+        return parse_timestamp(self.get('created_at'))
 
-    @property
+    @memoized
     def published_at(self) -> datetime:
-        time = self.get('published_at')
-        return datetime.fromisoformat(time[:-1]) if time else datetime.fromtimestamp(0)
+        return parse_timestamp(self.get('published_at'))
+
+
+class Commit(DataHolder):
+    _required_keys = ('id',)
+    _optional_keys = {'distinct': True, 'added': [], 'removed': [], 'modified': []}
+
+    @property
+    def id(self) -> str:
+        return self.get('id')
+
+    @property
+    def tree_id(self) -> str:
+        return self.get('tree_id')
+
+    @property
+    def distinct(self) -> bool:
+        return self.get('distinct')
+
+    @property
+    def message(self) -> str:
+        return self.get('message')
+
+    @memoized
+    def timestamp(self) -> datetime:
+        return parse_timestamp(self.get('timestamp'))
+
+    @property
+    def url(self) -> str:
+        return self.get('url')
+
+    @property
+    def author(self) -> dict:
+        return self.get('author')
+
+    @property
+    def committer(self) -> dict:
+        return self.get('committer')
+
+    @property
+    def added(self) -> list:
+        return self.get('added')
+
+    @property
+    def removed(self) -> list:
+        return self.get('removed')
+
+    @property
+    def modified(self) -> list:
+        return self.get('modified')
 
 
 # Todo - Compelete Installation class
@@ -0,0 +1,80 @@
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from GitHook.policy import _Scheduler
+
+# Called with the newest item of a key and the delivery ids merged into it, oldest first
+Flush = Callable[[Any, List[str]], None]
+
+
+def _ref_key(event_type: str, data: dict) -> Optional[Hashable]:
+    ref = data.get('ref')
+    if ref is None:
+        return None
+    return (data.get('repository') or {}).get('id'), ref, event_type
+
+
+class _Pending:
+    __slots__ = ('item', 'deliveries', 'flush')
+
+    def __init__(self, item, flush: Flush):
+        self.item = item
+        self.deliveries: List[str] = []
+        self.flush = flush
+
+
+class Coalescer:
+    # Holds deliveries of a key for a window counted from the first one, only the newest is handled once it ends
+    def __init__(self, window: float = 2.0, events: Optional[Iterable[str]] = ('push',),
+                 key: Callable[[str, dict], Optional[Hashable]] = _ref_key):
+        assert window > 0, 'window must be positive'
+        self._window = window
+        self._events = frozenset(events) if events is not None else None
+        self._key = key
+        self._pending: Dict[Hashable, _Pending] = {}
+        self._lock = threading.Lock()
+        self._scheduler = _Scheduler('githook-coalesce')
+
+    def key(self, event_type: str, data: dict) -> Optional[Hashable]:
+        # None for deliveries that are handled right away
+        if self._events is not None and event_type not in self._events:
+            return None
+        return self._key(event_type, data)
+
+    def offer(self, key: Hashable, delivery: Optional[str], item, flush: Flush):
+        # Returns the item this one supersedes, if any
+        superseded = None
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _Pending(item, flush)
+                self._scheduler.schedule(self._window, partial(self._expire, key, pending))
+            else:
+                superseded = pending.item
+                pending.item = item
+                pending.flush = flush
+            if delivery:
+                pending.deliveries.append(delivery)
+        return superseded
+
+    def _expire(self, key: Hashable, pending: _Pending):
+        with self._lock:
+            # A flush may already have taken it, later deliveries of the key then belong to a new window
+            if self._pending.get(key) is not pending:
+                return
+            del self._pending[key]
+        pending.flush(pending.item, pending.deliveries)
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for held in pending.values():
+            held.flush(held.item, held.deliveries)
+
+    def __len__(self):
+        return len(self._pending)
+
+    @property
+    def window(self) -> float:
+        return self._window
@@ -0,0 +1,155 @@
+import argparse
+import json
+import keyword
+import os
+import sys
+from typing import Dict, List, Tuple, Union
+
+SCHEMA = os.path.join(os.path.dirname(__file__), 'schema', 'webhooks.json')
+OUTPUT = os.path.join(os.path.dirname(__file__), 'generated.py')
+
+# Holders that are written by hand and can be referenced from the schema
+_HAND_WRITTEN = ('Collaborator', 'Repository', 'Licence', 'Installation', 'Release', 'Commit')
+_SCALARS = {'str': 'str', 'int': 'int', 'bool': 'bool', 'float': 'float', 'dict': 'dict', 'list': 'list'}
+_EVENT_KEYS = ('repository', 'sender')
+# Public names of DataHolder, a field can't shadow them. Kept literal so the generator never imports the
+# package it writes into and can rebuild a missing or broken module
+_RESERVED = ('analyse_data', 'compact', 'compact_class', 'fields', 'get', 'lazy_class')
+
+FieldType = Union[str, List[str]]
+
+
+def event_class_name(event: str) -> str:
+    # Matches the hand-written classes, push -> Push_Event, pull_request -> Pull_Request_Event
+    return event.title() + '_Event'
+
+
+def _check_field(owner: str, name: str):
+    if not name.isidentifier() or keyword.iskeyword(name) or name in _RESERVED:
+        raise ValueError(f'{owner} has a field that can not be an attribute: "{name}"')
+
+
+def _accessor(name: str, kind: FieldType, required: bool, models: Tuple[str, ...]) -> List[str]:
+    if isinstance(kind, list):
+        model = kind[0]
+        if model not in models:
+            raise ValueError(f'Unknown model "{model}" in field "{name}"')
+        return ['    @memoized',
+                f'    def {name}(self) -> List[{model}]:',
+                f"        return [self._wrap({model}, item) for item in self.get('{name}') or ()]"]
+
+    if kind in _SCALARS:
+        return ['    @property',
+                f'    def {name}(self) -> {_SCALARS[kind]}:',
+                f"        return self.get('{name}')"]
+
+    if kind == 'datetime':
+        if required:
+            return ['    @memoized',
+                    f'    def {name}(self) -> datetime:',
+                    f"        return parse_timestamp(self.get('{name}'))"]
+        return ['    @memoized',
+                f'    def {name}(self) -> Optional[datetime]:',
+                f"        value = self.get('{name}')",
+                '        return parse_timestamp(value) if value else None']
+
+    if kind not in models:
+        raise ValueError(f'Unknown type "{kind}" in field "{name}"')
+    if required:
+        return ['    @memoized',
+                f'    def {name}(self) -> {kind}:',
+                f"        return self._wrap({kind}, self.get('{name}'))"]
+    return ['    @memoized',
+            f'    def {name}(self) -> Optional[{kind}]:',
+            f"        data = self.get('{name}')",
+            f'        return self._wrap({kind}, data) if data else None']
+
+
+def _holder(name: str, base: str, spec: dict, required: Tuple[str, ...], models: Tuple[str, ...]) -> List[str]:
+    fields: Dict[str, FieldType] = spec.get('fields', {})
+    optional: dict = spec.get('optional', {})
+    for key in required + tuple(optional):
+        if key not in fields and key not in _EVENT_KEYS:
+            raise ValueError(f'{name} requires "{key}" which is not one of its fields')
+
+    lines = [f'class {name}({base}):']
+    if required:
+        lines.append(f'    _required_keys = {required!r}')
+    if optional:
+        lines.append(f'    _optional_keys = {optional!r}')
+
+    for field, kind in fields.items():
+        _check_field(name, field)
+        if len(lines) > 1:
+            lines.append('')
+        lines.extend(_accessor(field, kind, field in required, models))
+
+    if len(lines) == 1:
+        lines.append('    pass')
+    return lines
+
+
+def generate(schema: dict) -> str:
+    models = tuple(schema['models'])
+    known = _HAND_WRITTEN + models
+    specs = list(schema['models'].values()) + list(schema['events'].values())
+    kinds = {kind[0] if isinstance(kind, list) else kind for spec in specs for kind in spec.get('fields', {}).values()}
+    imported = [name for name in _HAND_WRITTEN if name in kinds]
+    lines = [f"# Generated by GitHook.codegen from schema/webhooks.json (version {schema['version']}), do not edit",
+             f"# Source: {schema.get('source', 'unknown')}",
+             'from datetime import datetime',
+             'from typing import List, Optional',
+             '',
+             'from .classes import ' + ', '.join(['DataHolder', 'memoized', 'parse_timestamp'] + imported),
+             'from .events import Event',
+             '',
+             f"SCHEMA_VERSION = {schema['version']!r}",
+             '',
+             '__all__ = [',
+             *[f'    {name!r},' for name in models + tuple(event_class_name(event) for event in schema['events'])],
+             ']']
+
+    for name, spec in schema['models'].items():
+        lines.extend(['', ''])
+        lines.extend(_holder(name, 'DataHolder', spec, tuple(spec.get('required', ())), known))
+
+    for event, spec in schema['events'].items():
+        # An event that lists repository or sender as optional (org and app level events) gets Optional accessors
+        required = tuple(spec.get('required', ())) + \
+            tuple(key for key in _EVENT_KEYS if key not in spec.get('optional', {}))
+        lines.extend(['', ''])
+        lines.extend(_holder(event_class_name(event), 'Event', spec, required, known))
+
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m GitHook.codegen',
+                                     description='Generate the event classes from the bundled webhook schema')
+    parser.add_argument('--schema', default=SCHEMA, help='schema to generate from')
+    parser.add_argument('--output', default=OUTPUT, help='module to write')
+    parser.add_argument('--check', action='store_true', help='only report whether the output is up to date')
+    args = parser.parse_args(argv)
+
+    with open(args.schema, 'r', encoding='utf-8') as file:
+        source = generate(json.load(file))
+
+    current = None
+    if os.path.exists(args.output):
+        with open(args.output, 'r', encoding='utf-8') as file:
+            current = file.read()
+
+    if args.check:
+        if current != source:
+            print(f'{args.output} is out of date, run python -m GitHook.codegen', file=sys.stderr)
+            return 1
+        return 0
+
+    if current != source:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class DeliveryCache:
+    # Records the delivery and returns whether it had already been recorded
+    def seen(self, delivery: str) -> bool:
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    # Forgets a delivery that was turned away after being recorded, so github's redelivery is let through
+    def discard(self, delivery: str):
+        pass
+
+    # Called in a freshly forked worker, stores holding connections or handles open new ones
+    def reopen(self):
+        pass
+
+
+class MemoryDeliveryCache(DeliveryCache):
+    def __init__(self, size: int = 10000, ttl: float = 3600):
+        assert size > 0, 'size must be positive'
+        self._size = size
+        self._ttl = ttl
+        # delivery -> expiry, oldest first since every entry lives for the same ttl
+        self._deliveries: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def seen(self, delivery: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            while self._deliveries:
+                oldest, expiry = next(iter(self._deliveries.items()))
+                if expiry > now:
+                    break
+                del self._deliveries[oldest]
+
+            if delivery in self._deliveries:
+                return True
+
+            self._deliveries[delivery] = now + self._ttl
+            if len(self._deliveries) > self._size:
+                self._deliveries.popitem(last=False)
+            return False
+
+    def discard(self, delivery: str):
+        with self._lock:
+            self._deliveries.pop(delivery, None)
+
+    def clear(self):
+        with self._lock:
+            self._deliveries.clear()
+
+    def __len__(self):
+        return len(self._deliveries)
+
+
+class SQLiteDeliveryCache(DeliveryCache):
+    def __init__(self, path: str, size: int = 100000, ttl: float = 3600):
+        assert size > 0, 'size must be positive'
+        self._size = size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._inserts = 0
+        self._path = path
+        self._connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, timeout=30, check_same_thread=False, isolation_level=None)
+        if self._path != ':memory:':
+            connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('CREATE TABLE IF NOT EXISTS deliveries (guid TEXT PRIMARY KEY, expires REAL NOT NULL)')
+        connection.execute('CREATE INDEX IF NOT EXISTS deliveries_expires ON deliveries (expires)')
+        return connection
+
+    def seen(self, delivery: str) -> bool:
+        # Wall clock time since the store is shared across processes
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                'INSERT INTO deliveries (guid, expires) VALUES (?, ?) '
+                'ON CONFLICT (guid) DO UPDATE SET expires = excluded.expires WHERE deliveries.expires <= ?',
+                (delivery, now + self._ttl, now)
+            )
+            if cursor.rowcount == 0:
+                return True
+
+            self._inserts += 1
+            if self._inserts >= max(1, self._size // 10):
+                self._inserts = 0
+                self._prune(now)
+            return False
+
+    def _prune(self, now: float):
+        self._connection.execute('DELETE FROM deliveries WHERE expires <= ?', (now,))
+        self._connection.execute(
+            'DELETE FROM deliveries WHERE guid IN (SELECT guid FROM deliveries ORDER BY expires DESC LIMIT -1 OFFSET ?)',
+            (self._size,)
+        )
+
+    def discard(self, delivery: str):
+        with self._lock:
+            self._connection.execute('DELETE FROM deliveries WHERE guid = ?', (delivery,))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute('DELETE FROM deliveries')
+
+    def reopen(self):
+        # The parent's connection and lock are left as they were at fork time, neither is touched
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,118 @@
+import logging
+import threading
+from functools import partial
+from typing import Callable, Any, Hashable, Optional, Union
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+_logger = logging.getLogger("webhook")
+
+
+class Dispatcher:
+    # The callback, if any, receives the result of a job that completed without raising.
+    # Jobs submitted with the same key run in submission order, dispatchers without ordering ignore it.
+    # With block a full dispatcher is waited on instead of refusing the job
+    def submit(self, func, *args, callback: Callable[[Any], None] = None, key: Hashable = None,
+               block: bool = False) -> bool:
+        raise NotImplementedError
+
+    def partition_key(self, data: dict) -> Optional[Hashable]:
+        return None
+
+    def shutdown(self, wait: bool = True):
+        pass
+
+
+class PoolDispatcher(Dispatcher):
+    def __init__(self, workers: int = 4, queue_size: int = 64, processes: bool = False):
+        assert workers > 0, 'workers must be positive'
+        assert queue_size >= 0, 'queue_size can not be negative'
+
+        executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        self._executor = executor(max_workers=workers)
+        # Running plus queued jobs, anything beyond is rejected instead of buffered
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._closed = False
+
+    def submit(self, func, *args, callback: Callable[[Any], None] = None, key: Hashable = None,
+               block: bool = False) -> bool:
+        if self._closed or not self._slots.acquire(blocking=block):
+            return False
+        if self._closed:
+            self._slots.release()
+            return False
+
+        try:
+            future = self._executor_for(key).submit(func, *args)
+        except RuntimeError:
+            self._slots.release()
+            return False
+
+        future.add_done_callback(partial(self._release, callback))
+        return True
+
+    def _executor_for(self, key: Hashable) -> Executor:
+        return self._executor
+
+    def _release(self, callback, future):
+        self._slots.release()
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            # Handler errors are caught inside the job, this is the job itself failing, e.g. a handler that
+            # can't be pickled for a worker process
+            _logger.error("Dispatched job failed", exc_info=future.exception())
+        elif callback is not None:
+            callback(future.result())
+
+    def shutdown(self, wait: bool = True):
+        self._closed = True
+        self._executor.shutdown(wait=wait)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+def _repository_key(data: dict) -> Optional[Hashable]:
+    return (data.get('repository') or {}).get('id')
+
+
+def _ref_key(data: dict) -> Optional[Hashable]:
+    return (data.get('repository') or {}).get('full_name'), data.get('ref')
+
+
+PARTITION_KEYS = {'repository': _repository_key, 'ref': _ref_key}
+
+
+class PartitionedDispatcher(PoolDispatcher):
+    # One serial queue per partition, deliveries sharing a key are handled one at a time in arrival order
+    # while different partitions run in parallel
+    def __init__(self, partitions: int = 8, key: Union[str, Callable[[dict], Hashable]] = 'repository',
+                 queue_size: int = 64):
+        assert partitions > 0, 'partitions must be positive'
+        assert queue_size >= 0, 'queue_size can not be negative'
+        if isinstance(key, str):
+            if key not in PARTITION_KEYS:
+                raise ValueError(f'Unknown partition key "{key}", expected one of {", ".join(PARTITION_KEYS)}')
+            key = PARTITION_KEYS[key]
+
+        self._key = key
+        self._partitions = [ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'githook-partition-{index}')
+                            for index in range(partitions)]
+        self._slots = threading.BoundedSemaphore(partitions + queue_size)
+        self._closed = False
+
+    def partition_key(self, data: dict) -> Optional[Hashable]:
+        return self._key(data)
+
+    def _executor_for(self, key: Hashable) -> Executor:
+        return self._partitions[hash(key) % len(self._partitions)]
+
+    def shutdown(self, wait: bool = True):
+        self._closed = True
+        for executor in self._partitions:
+            executor.shutdown(wait=wait)
+
+    @property
+    def partitions(self) -> int:
+        return len(self._partitions)
@@ -0,0 +1,141 @@
+import fnmatch
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Type, Union
+
+from GitHook.events import Event
+from GitHook.policy import HandlerPolicy, PolicyHandler
+
+Patterns = Union[str, Iterable[str], None]
+
+
+def _compile(patterns: Patterns) -> Optional[Pattern]:
+    if patterns is None:
+        return None
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    return re.compile('|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in patterns))
+
+
+class HookFilter:
+    __slots__ = ('_actions', '_ref', '_branch', '_repository', '_sender')
+
+    def __init__(self, action: Patterns = None, ref: Patterns = None, branch: Patterns = None,
+                 repository: Patterns = None, sender: Patterns = None):
+        self._actions = None if action is None else frozenset((action,) if isinstance(action, str) else action)
+        self._ref = _compile(ref)
+        self._branch = _compile(branch)
+        self._repository = _compile(repository)
+        self._sender = _compile(sender)
+
+    @property
+    def actions(self) -> Optional[frozenset]:
+        return self._actions
+
+    # Works on the raw payload so deliveries that don't match never build any model objects
+    def matches(self, data: dict) -> bool:
+        if self._actions is not None and data.get('action') not in self._actions:
+            return False
+
+        if self._ref is not None or self._branch is not None:
+            ref = data.get('ref')
+            if not isinstance(ref, str):
+                return False
+            if self._ref is not None and not self._ref.match(ref):
+                return False
+            if self._branch is not None and not (ref.startswith('refs/heads/') and self._branch.match(ref[11:])):
+                return False
+
+        if self._repository is not None:
+            repository = data.get('repository') or {}
+            full_name = repository.get('full_name')
+            if full_name is None and repository.get('owner'):
+                full_name = f"{repository['owner'].get('login')}/{repository.get('name')}"
+            if full_name is None or not self._repository.match(full_name):
+                return False
+
+        if self._sender is not None:
+            login = (data.get('sender') or {}).get('login')
+            if login is None or not self._sender.match(login):
+                return False
+
+        return True
+
+
+class Selection(NamedTuple):
+    event: Type[Event]
+    call: Callable
+    # Handlers run in ascending priority, those sharing one may run concurrently
+    priority: int = 0
+
+
+class _Handler:
+    __slots__ = ('order', 'priority', 'event', 'func', 'call', 'filter')
+
+    def __init__(self, order: int, priority: int, event: Type[Event], func: Callable,
+                 hook_filter: Optional[HookFilter], policy: Optional[HandlerPolicy]):
+        self.order = order
+        self.priority = priority
+        self.event = event
+        self.func = func
+        # What dispatch invokes, the registered function itself unless a policy wraps it
+        self.call = func if policy is None else PolicyHandler(func, policy)
+        self.filter = hook_filter
+
+
+def _dispatch_order(handler: _Handler):
+    return handler.priority, handler.order
+
+
+class HandlerIndex:
+    def __init__(self):
+        self._order = 0
+        self._unfiltered: List[_Handler] = []
+        self._by_action: Dict[str, List[_Handler]] = {}
+        self._filtered: List[_Handler] = []
+
+    def add(self, func: Callable, event: Type[Event], hook_filter: HookFilter = None, policy: HandlerPolicy = None,
+            priority: int = 0):
+        handler = _Handler(self._order, priority, event, func, hook_filter, policy)
+        self._order += 1
+
+        if hook_filter is None:
+            self._unfiltered.append(handler)
+            self._unfiltered.sort(key=_dispatch_order)
+        elif hook_filter.actions is not None:
+            for action in hook_filter.actions:
+                self._by_action.setdefault(action, []).append(handler)
+        else:
+            self._filtered.append(handler)
+
+    def remove(self, func: Callable, event: Type[Event]):
+        def keep(handler: _Handler):
+            return handler.func != func or handler.event is not event
+
+        self._unfiltered = list(filter(keep, self._unfiltered))
+        self._filtered = list(filter(keep, self._filtered))
+        for action, handlers in list(self._by_action.items()):
+            handlers = list(filter(keep, handlers))
+            if handlers:
+                self._by_action[action] = handlers
+            else:
+                del self._by_action[action]
+
+    def select(self, data: dict) -> List[Selection]:
+        action = data.get('action')
+        candidates = self._by_action.get(action, []) if isinstance(action, str) else []
+        if candidates or self._filtered:
+            candidates = [handler for handler in candidates + self._filtered if handler.filter.matches(data)]
+            candidates = sorted(self._unfiltered + candidates, key=_dispatch_order)
+        else:
+            candidates = self._unfiltered
+
+        return [Selection(handler.event, handler.call, handler.priority) for handler in candidates]
+
+    def __iter__(self) -> Iterator[_Handler]:
+        handlers = {id(handler): handler for handler in self._unfiltered + self._filtered}
+        for action_handlers in self._by_action.values():
+            handlers.update((id(handler), handler) for handler in action_handlers)
+        return iter(sorted(handlers.values(), key=lambda handler: handler.order))
+
+    def __bool__(self):
+        return bool(self._unfiltered or self._by_action or self._filtered)
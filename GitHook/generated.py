@@ -0,0 +1,2356 @@
+# Generated by GitHook.codegen from schema/webhooks.json (version 2022-11-28), do not edit
+# Source: https://docs.github.com/en/webhooks/webhook-events-and-payloads
+from datetime import datetime
+from typing import List, Optional
+
+from .classes import DataHolder, memoized, parse_timestamp, Collaborator, Repository, Installation
+from .events import Event
+
+SCHEMA_VERSION = '2022-11-28'
+
+__all__ = [
+    'Label',
+    'Milestone',
+    'BranchRef',
+    'PullRequest',
+    'Issue',
+    'Comment',
+    'Review',
+    'WorkflowRun',
+    'WorkflowJob',
+    'Workflow',
+    'CheckSuite',
+    'CheckRun',
+    'Deployment',
+    'DeploymentStatus',
+    'Team',
+    'Project',
+    'ProjectColumn',
+    'ProjectCard',
+    'Discussion',
+    'Package',
+    'Alert',
+    'Branch_Protection_Rule_Event',
+    'Check_Run_Event',
+    'Check_Suite_Event',
+    'Code_Scanning_Alert_Event',
+    'Commit_Comment_Event',
+    'Content_Reference_Event',
+    'Create_Event',
+    'Delete_Event',
+    'Deploy_Key_Event',
+    'Deployment_Event',
+    'Deployment_Status_Event',
+    'Discussion_Event',
+    'Discussion_Comment_Event',
+    'Fork_Event',
+    'Github_App_Authorization_Event',
+    'Gollum_Event',
+    'Installation_Event',
+    'Installation_Repositories_Event',
+    'Issue_Comment_Event',
+    'Issues_Event',
+    'Label_Event',
+    'Marketplace_Purchase_Event',
+    'Member_Event',
+    'Membership_Event',
+    'Meta_Event',
+    'Milestone_Event',
+    'Org_Block_Event',
+    'Organization_Event',
+    'Package_Event',
+    'Page_Build_Event',
+    'Ping_Event',
+    'Project_Event',
+    'Project_Card_Event',
+    'Project_Column_Event',
+    'Public_Event',
+    'Pull_Request_Event',
+    'Pull_Request_Review_Event',
+    'Pull_Request_Review_Comment_Event',
+    'Repository_Event',
+    'Repository_Dispatch_Event',
+    'Repository_Import_Event',
+    'Repository_Vulnerability_Alert_Event',
+    'Secret_Scanning_Alert_Event',
+    'Security_Advisory_Event',
+    'Sponsorship_Event',
+    'Star_Event',
+    'Status_Event',
+    'Team_Event',
+    'Team_Add_Event',
+    'Watch_Event',
+    'Workflow_Dispatch_Event',
+    'Workflow_Job_Event',
+    'Workflow_Run_Event',
+]
+
+
+class Label(DataHolder):
+    _required_keys = ('id', 'name')
+    _optional_keys = {'default': False}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def url(self) -> str:
+        return self.get('url')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def description(self) -> str:
+        return self.get('description')
+
+    @property
+    def color(self) -> str:
+        return self.get('color')
+
+    @property
+    def default(self) -> bool:
+        return self.get('default')
+
+
+class Milestone(DataHolder):
+    _required_keys = ('id', 'number', 'title')
+    _optional_keys = {'state': 'open', 'open_issues': 0, 'closed_issues': 0}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def number(self) -> int:
+        return self.get('number')
+
+    @property
+    def title(self) -> str:
+        return self.get('title')
+
+    @property
+    def description(self) -> str:
+        return self.get('description')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @memoized
+    def creator(self) -> Optional[Collaborator]:
+        data = self.get('creator')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def open_issues(self) -> int:
+        return self.get('open_issues')
+
+    @property
+    def closed_issues(self) -> int:
+        return self.get('closed_issues')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def closed_at(self) -> Optional[datetime]:
+        value = self.get('closed_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def due_on(self) -> Optional[datetime]:
+        value = self.get('due_on')
+        return parse_timestamp(value) if value else None
+
+
+class BranchRef(DataHolder):
+    _required_keys = ('ref', 'sha')
+
+    @property
+    def label(self) -> str:
+        return self.get('label')
+
+    @property
+    def ref(self) -> str:
+        return self.get('ref')
+
+    @property
+    def sha(self) -> str:
+        return self.get('sha')
+
+    @memoized
+    def user(self) -> Optional[Collaborator]:
+        data = self.get('user')
+        return self._wrap(Collaborator, data) if data else None
+
+    @memoized
+    def repo(self) -> Optional[Repository]:
+        data = self.get('repo')
+        return self._wrap(Repository, data) if data else None
+
+
+class PullRequest(DataHolder):
+    _required_keys = ('id', 'number', 'state')
+    _optional_keys = {'locked': False, 'draft': False, 'merged': False, 'labels': [], 'assignees': [], 'requested_reviewers': []}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def number(self) -> int:
+        return self.get('number')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @property
+    def locked(self) -> bool:
+        return self.get('locked')
+
+    @property
+    def title(self) -> str:
+        return self.get('title')
+
+    @property
+    def body(self) -> str:
+        return self.get('body')
+
+    @memoized
+    def user(self) -> Optional[Collaborator]:
+        data = self.get('user')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def diff_url(self) -> str:
+        return self.get('diff_url')
+
+    @property
+    def patch_url(self) -> str:
+        return self.get('patch_url')
+
+    @memoized
+    def labels(self) -> List[Label]:
+        return [self._wrap(Label, item) for item in self.get('labels') or ()]
+
+    @memoized
+    def milestone(self) -> Optional[Milestone]:
+        data = self.get('milestone')
+        return self._wrap(Milestone, data) if data else None
+
+    @memoized
+    def assignees(self) -> List[Collaborator]:
+        return [self._wrap(Collaborator, item) for item in self.get('assignees') or ()]
+
+    @memoized
+    def requested_reviewers(self) -> List[Collaborator]:
+        return [self._wrap(Collaborator, item) for item in self.get('requested_reviewers') or ()]
+
+    @memoized
+    def head(self) -> Optional[BranchRef]:
+        data = self.get('head')
+        return self._wrap(BranchRef, data) if data else None
+
+    @memoized
+    def base(self) -> Optional[BranchRef]:
+        data = self.get('base')
+        return self._wrap(BranchRef, data) if data else None
+
+    @property
+    def draft(self) -> bool:
+        return self.get('draft')
+
+    @property
+    def merged(self) -> bool:
+        return self.get('merged')
+
+    @property
+    def mergeable(self) -> bool:
+        return self.get('mergeable')
+
+    @property
+    def merge_commit_sha(self) -> str:
+        return self.get('merge_commit_sha')
+
+    @memoized
+    def merged_by(self) -> Optional[Collaborator]:
+        data = self.get('merged_by')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def comments(self) -> int:
+        return self.get('comments')
+
+    @property
+    def review_comments(self) -> int:
+        return self.get('review_comments')
+
+    @property
+    def commits(self) -> int:
+        return self.get('commits')
+
+    @property
+    def additions(self) -> int:
+        return self.get('additions')
+
+    @property
+    def deletions(self) -> int:
+        return self.get('deletions')
+
+    @property
+    def changed_files(self) -> int:
+        return self.get('changed_files')
+
+    @property
+    def author_association(self) -> str:
+        return self.get('author_association')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def closed_at(self) -> Optional[datetime]:
+        value = self.get('closed_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def merged_at(self) -> Optional[datetime]:
+        value = self.get('merged_at')
+        return parse_timestamp(value) if value else None
+
+
+class Issue(DataHolder):
+    _required_keys = ('id', 'number', 'state')
+    _optional_keys = {'locked': False, 'labels': [], 'assignees': [], 'comments': 0}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def number(self) -> int:
+        return self.get('number')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @property
+    def state_reason(self) -> str:
+        return self.get('state_reason')
+
+    @property
+    def locked(self) -> bool:
+        return self.get('locked')
+
+    @property
+    def title(self) -> str:
+        return self.get('title')
+
+    @property
+    def body(self) -> str:
+        return self.get('body')
+
+    @memoized
+    def user(self) -> Optional[Collaborator]:
+        data = self.get('user')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @memoized
+    def labels(self) -> List[Label]:
+        return [self._wrap(Label, item) for item in self.get('labels') or ()]
+
+    @memoized
+    def milestone(self) -> Optional[Milestone]:
+        data = self.get('milestone')
+        return self._wrap(Milestone, data) if data else None
+
+    @memoized
+    def assignees(self) -> List[Collaborator]:
+        return [self._wrap(Collaborator, item) for item in self.get('assignees') or ()]
+
+    @property
+    def comments(self) -> int:
+        return self.get('comments')
+
+    @property
+    def pull_request(self) -> dict:
+        return self.get('pull_request')
+
+    @property
+    def author_association(self) -> str:
+        return self.get('author_association')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def closed_at(self) -> Optional[datetime]:
+        value = self.get('closed_at')
+        return parse_timestamp(value) if value else None
+
+
+class Comment(DataHolder):
+    _required_keys = ('id', 'body')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def body(self) -> str:
+        return self.get('body')
+
+    @memoized
+    def user(self) -> Optional[Collaborator]:
+        data = self.get('user')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def author_association(self) -> str:
+        return self.get('author_association')
+
+    @property
+    def path(self) -> str:
+        return self.get('path')
+
+    @property
+    def position(self) -> int:
+        return self.get('position')
+
+    @property
+    def line(self) -> int:
+        return self.get('line')
+
+    @property
+    def commit_id(self) -> str:
+        return self.get('commit_id')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class Review(DataHolder):
+    _required_keys = ('id', 'state')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def body(self) -> str:
+        return self.get('body')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @memoized
+    def user(self) -> Optional[Collaborator]:
+        data = self.get('user')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def commit_id(self) -> str:
+        return self.get('commit_id')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def author_association(self) -> str:
+        return self.get('author_association')
+
+    @memoized
+    def submitted_at(self) -> Optional[datetime]:
+        value = self.get('submitted_at')
+        return parse_timestamp(value) if value else None
+
+
+class WorkflowRun(DataHolder):
+    _required_keys = ('id', 'name', 'status')
+    _optional_keys = {'run_attempt': 1}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def display_title(self) -> str:
+        return self.get('display_title')
+
+    @property
+    def run_number(self) -> int:
+        return self.get('run_number')
+
+    @property
+    def run_attempt(self) -> int:
+        return self.get('run_attempt')
+
+    @property
+    def event(self) -> str:
+        return self.get('event')
+
+    @property
+    def status(self) -> str:
+        return self.get('status')
+
+    @property
+    def conclusion(self) -> str:
+        return self.get('conclusion')
+
+    @property
+    def workflow_id(self) -> int:
+        return self.get('workflow_id')
+
+    @property
+    def head_branch(self) -> str:
+        return self.get('head_branch')
+
+    @property
+    def head_sha(self) -> str:
+        return self.get('head_sha')
+
+    @property
+    def path(self) -> str:
+        return self.get('path')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @memoized
+    def actor(self) -> Optional[Collaborator]:
+        data = self.get('actor')
+        return self._wrap(Collaborator, data) if data else None
+
+    @memoized
+    def triggering_actor(self) -> Optional[Collaborator]:
+        data = self.get('triggering_actor')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def pull_requests(self) -> list:
+        return self.get('pull_requests')
+
+    @property
+    def head_commit(self) -> dict:
+        return self.get('head_commit')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def run_started_at(self) -> Optional[datetime]:
+        value = self.get('run_started_at')
+        return parse_timestamp(value) if value else None
+
+
+class WorkflowJob(DataHolder):
+    _required_keys = ('id', 'run_id', 'status')
+    _optional_keys = {'labels': [], 'steps': []}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def run_id(self) -> int:
+        return self.get('run_id')
+
+    @property
+    def run_attempt(self) -> int:
+        return self.get('run_attempt')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def workflow_name(self) -> str:
+        return self.get('workflow_name')
+
+    @property
+    def head_branch(self) -> str:
+        return self.get('head_branch')
+
+    @property
+    def head_sha(self) -> str:
+        return self.get('head_sha')
+
+    @property
+    def status(self) -> str:
+        return self.get('status')
+
+    @property
+    def conclusion(self) -> str:
+        return self.get('conclusion')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def labels(self) -> list:
+        return self.get('labels')
+
+    @property
+    def steps(self) -> list:
+        return self.get('steps')
+
+    @property
+    def runner_id(self) -> int:
+        return self.get('runner_id')
+
+    @property
+    def runner_name(self) -> str:
+        return self.get('runner_name')
+
+    @property
+    def runner_group_name(self) -> str:
+        return self.get('runner_group_name')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def started_at(self) -> Optional[datetime]:
+        value = self.get('started_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def completed_at(self) -> Optional[datetime]:
+        value = self.get('completed_at')
+        return parse_timestamp(value) if value else None
+
+
+class Workflow(DataHolder):
+    _required_keys = ('id', 'name', 'path')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def path(self) -> str:
+        return self.get('path')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def badge_url(self) -> str:
+        return self.get('badge_url')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class CheckSuite(DataHolder):
+    _required_keys = ('id', 'head_sha', 'status')
+    _optional_keys = {'pull_requests': []}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def head_branch(self) -> str:
+        return self.get('head_branch')
+
+    @property
+    def head_sha(self) -> str:
+        return self.get('head_sha')
+
+    @property
+    def status(self) -> str:
+        return self.get('status')
+
+    @property
+    def conclusion(self) -> str:
+        return self.get('conclusion')
+
+    @property
+    def before(self) -> str:
+        return self.get('before')
+
+    @property
+    def after(self) -> str:
+        return self.get('after')
+
+    @property
+    def pull_requests(self) -> list:
+        return self.get('pull_requests')
+
+    @property
+    def app(self) -> dict:
+        return self.get('app')
+
+    @property
+    def latest_check_runs_count(self) -> int:
+        return self.get('latest_check_runs_count')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class CheckRun(DataHolder):
+    _required_keys = ('id', 'head_sha', 'name', 'status')
+    _optional_keys = {'pull_requests': []}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def head_sha(self) -> str:
+        return self.get('head_sha')
+
+    @property
+    def external_id(self) -> str:
+        return self.get('external_id')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def status(self) -> str:
+        return self.get('status')
+
+    @property
+    def conclusion(self) -> str:
+        return self.get('conclusion')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def details_url(self) -> str:
+        return self.get('details_url')
+
+    @property
+    def output(self) -> dict:
+        return self.get('output')
+
+    @memoized
+    def check_suite(self) -> Optional[CheckSuite]:
+        data = self.get('check_suite')
+        return self._wrap(CheckSuite, data) if data else None
+
+    @property
+    def app(self) -> dict:
+        return self.get('app')
+
+    @property
+    def pull_requests(self) -> list:
+        return self.get('pull_requests')
+
+    @memoized
+    def started_at(self) -> Optional[datetime]:
+        value = self.get('started_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def completed_at(self) -> Optional[datetime]:
+        value = self.get('completed_at')
+        return parse_timestamp(value) if value else None
+
+
+class Deployment(DataHolder):
+    _required_keys = ('id', 'sha', 'ref', 'environment')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def sha(self) -> str:
+        return self.get('sha')
+
+    @property
+    def ref(self) -> str:
+        return self.get('ref')
+
+    @property
+    def task(self) -> str:
+        return self.get('task')
+
+    @property
+    def payload(self) -> dict:
+        return self.get('payload')
+
+    @property
+    def environment(self) -> str:
+        return self.get('environment')
+
+    @property
+    def description(self) -> str:
+        return self.get('description')
+
+    @memoized
+    def creator(self) -> Optional[Collaborator]:
+        data = self.get('creator')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def production_environment(self) -> bool:
+        return self.get('production_environment')
+
+    @property
+    def transient_environment(self) -> bool:
+        return self.get('transient_environment')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class DeploymentStatus(DataHolder):
+    _required_keys = ('id', 'state')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @property
+    def description(self) -> str:
+        return self.get('description')
+
+    @property
+    def environment(self) -> str:
+        return self.get('environment')
+
+    @property
+    def target_url(self) -> str:
+        return self.get('target_url')
+
+    @property
+    def log_url(self) -> str:
+        return self.get('log_url')
+
+    @property
+    def environment_url(self) -> str:
+        return self.get('environment_url')
+
+    @memoized
+    def creator(self) -> Optional[Collaborator]:
+        data = self.get('creator')
+        return self._wrap(Collaborator, data) if data else None
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class Team(DataHolder):
+    _required_keys = ('id', 'name')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def slug(self) -> str:
+        return self.get('slug')
+
+    @property
+    def description(self) -> str:
+        return self.get('description')
+
+    @property
+    def privacy(self) -> str:
+        return self.get('privacy')
+
+    @property
+    def permission(self) -> str:
+        return self.get('permission')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def parent(self) -> dict:
+        return self.get('parent')
+
+
+class Project(DataHolder):
+    _required_keys = ('id', 'number', 'name')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def number(self) -> int:
+        return self.get('number')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def body(self) -> str:
+        return self.get('body')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @memoized
+    def creator(self) -> Optional[Collaborator]:
+        data = self.get('creator')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class ProjectColumn(DataHolder):
+    _required_keys = ('id', 'name')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def project_url(self) -> str:
+        return self.get('project_url')
+
+    @property
+    def cards_url(self) -> str:
+        return self.get('cards_url')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class ProjectCard(DataHolder):
+    _required_keys = ('id', 'column_id')
+    _optional_keys = {'archived': False}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def column_id(self) -> int:
+        return self.get('column_id')
+
+    @property
+    def note(self) -> str:
+        return self.get('note')
+
+    @property
+    def archived(self) -> bool:
+        return self.get('archived')
+
+    @memoized
+    def creator(self) -> Optional[Collaborator]:
+        data = self.get('creator')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def content_url(self) -> str:
+        return self.get('content_url')
+
+    @property
+    def after_id(self) -> int:
+        return self.get('after_id')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class Discussion(DataHolder):
+    _required_keys = ('id', 'number', 'title')
+    _optional_keys = {'locked': False, 'comments': 0}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def node_id(self) -> str:
+        return self.get('node_id')
+
+    @property
+    def number(self) -> int:
+        return self.get('number')
+
+    @property
+    def title(self) -> str:
+        return self.get('title')
+
+    @property
+    def body(self) -> str:
+        return self.get('body')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @property
+    def locked(self) -> bool:
+        return self.get('locked')
+
+    @property
+    def comments(self) -> int:
+        return self.get('comments')
+
+    @property
+    def category(self) -> dict:
+        return self.get('category')
+
+    @property
+    def answer_html_url(self) -> str:
+        return self.get('answer_html_url')
+
+    @memoized
+    def user(self) -> Optional[Collaborator]:
+        data = self.get('user')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def author_association(self) -> str:
+        return self.get('author_association')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class Package(DataHolder):
+    _required_keys = ('id', 'name')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def namespace(self) -> str:
+        return self.get('namespace')
+
+    @property
+    def description(self) -> str:
+        return self.get('description')
+
+    @property
+    def ecosystem(self) -> str:
+        return self.get('ecosystem')
+
+    @property
+    def package_type(self) -> str:
+        return self.get('package_type')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @memoized
+    def owner(self) -> Optional[Collaborator]:
+        data = self.get('owner')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def package_version(self) -> dict:
+        return self.get('package_version')
+
+    @property
+    def registry(self) -> dict:
+        return self.get('registry')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class Alert(DataHolder):
+    _required_keys = ('number',)
+
+    @property
+    def number(self) -> int:
+        return self.get('number')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @property
+    def html_url(self) -> str:
+        return self.get('html_url')
+
+    @property
+    def rule(self) -> dict:
+        return self.get('rule')
+
+    @property
+    def tool(self) -> dict:
+        return self.get('tool')
+
+    @property
+    def most_recent_instance(self) -> dict:
+        return self.get('most_recent_instance')
+
+    @property
+    def secret_type(self) -> str:
+        return self.get('secret_type')
+
+    @property
+    def resolution(self) -> str:
+        return self.get('resolution')
+
+    @memoized
+    def resolved_by(self) -> Optional[Collaborator]:
+        data = self.get('resolved_by')
+        return self._wrap(Collaborator, data) if data else None
+
+    @memoized
+    def dismissed_by(self) -> Optional[Collaborator]:
+        data = self.get('dismissed_by')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def dismissed_reason(self) -> str:
+        return self.get('dismissed_reason')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def dismissed_at(self) -> Optional[datetime]:
+        value = self.get('dismissed_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def resolved_at(self) -> Optional[datetime]:
+        value = self.get('resolved_at')
+        return parse_timestamp(value) if value else None
+
+
+class Branch_Protection_Rule_Event(Event):
+    _required_keys = ('action', 'rule', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def rule(self) -> dict:
+        return self.get('rule')
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Check_Run_Event(Event):
+    _required_keys = ('action', 'check_run', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def check_run(self) -> CheckRun:
+        return self._wrap(CheckRun, self.get('check_run'))
+
+
+class Check_Suite_Event(Event):
+    _required_keys = ('action', 'check_suite', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def check_suite(self) -> CheckSuite:
+        return self._wrap(CheckSuite, self.get('check_suite'))
+
+
+class Code_Scanning_Alert_Event(Event):
+    _required_keys = ('action', 'alert', 'ref', 'commit_oid', 'repository')
+    _optional_keys = {'sender': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def alert(self) -> Alert:
+        return self._wrap(Alert, self.get('alert'))
+
+    @property
+    def ref(self) -> str:
+        return self.get('ref')
+
+    @property
+    def commit_oid(self) -> str:
+        return self.get('commit_oid')
+
+    @memoized
+    def sender(self) -> Optional[Collaborator]:
+        data = self.get('sender')
+        return self._wrap(Collaborator, data) if data else None
+
+
+class Commit_Comment_Event(Event):
+    _required_keys = ('action', 'comment', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def comment(self) -> Comment:
+        return self._wrap(Comment, self.get('comment'))
+
+
+class Content_Reference_Event(Event):
+    _required_keys = ('action', 'content_reference', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def content_reference(self) -> dict:
+        return self.get('content_reference')
+
+
+class Create_Event(Event):
+    _required_keys = ('ref', 'ref_type', 'repository', 'sender')
+
+    @property
+    def ref(self) -> str:
+        return self.get('ref')
+
+    @property
+    def ref_type(self) -> str:
+        return self.get('ref_type')
+
+    @property
+    def master_branch(self) -> str:
+        return self.get('master_branch')
+
+    @property
+    def description(self) -> str:
+        return self.get('description')
+
+    @property
+    def pusher_type(self) -> str:
+        return self.get('pusher_type')
+
+
+class Delete_Event(Event):
+    _required_keys = ('ref', 'ref_type', 'repository', 'sender')
+
+    @property
+    def ref(self) -> str:
+        return self.get('ref')
+
+    @property
+    def ref_type(self) -> str:
+        return self.get('ref_type')
+
+    @property
+    def pusher_type(self) -> str:
+        return self.get('pusher_type')
+
+
+class Deploy_Key_Event(Event):
+    _required_keys = ('action', 'key', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def key(self) -> dict:
+        return self.get('key')
+
+
+class Deployment_Event(Event):
+    _required_keys = ('action', 'deployment', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def deployment(self) -> Deployment:
+        return self._wrap(Deployment, self.get('deployment'))
+
+    @memoized
+    def workflow(self) -> Optional[Workflow]:
+        data = self.get('workflow')
+        return self._wrap(Workflow, data) if data else None
+
+    @memoized
+    def workflow_run(self) -> Optional[WorkflowRun]:
+        data = self.get('workflow_run')
+        return self._wrap(WorkflowRun, data) if data else None
+
+
+class Deployment_Status_Event(Event):
+    _required_keys = ('action', 'deployment_status', 'deployment', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def deployment_status(self) -> DeploymentStatus:
+        return self._wrap(DeploymentStatus, self.get('deployment_status'))
+
+    @memoized
+    def deployment(self) -> Deployment:
+        return self._wrap(Deployment, self.get('deployment'))
+
+
+class Discussion_Event(Event):
+    _required_keys = ('action', 'discussion', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def discussion(self) -> Discussion:
+        return self._wrap(Discussion, self.get('discussion'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def answer(self) -> Optional[Comment]:
+        data = self.get('answer')
+        return self._wrap(Comment, data) if data else None
+
+    @memoized
+    def label(self) -> Optional[Label]:
+        data = self.get('label')
+        return self._wrap(Label, data) if data else None
+
+
+class Discussion_Comment_Event(Event):
+    _required_keys = ('action', 'comment', 'discussion', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def comment(self) -> Comment:
+        return self._wrap(Comment, self.get('comment'))
+
+    @memoized
+    def discussion(self) -> Discussion:
+        return self._wrap(Discussion, self.get('discussion'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Fork_Event(Event):
+    _required_keys = ('forkee', 'repository', 'sender')
+
+    @memoized
+    def forkee(self) -> Repository:
+        return self._wrap(Repository, self.get('forkee'))
+
+
+class Github_App_Authorization_Event(Event):
+    _required_keys = ('action', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Gollum_Event(Event):
+    _required_keys = ('pages', 'repository', 'sender')
+
+    @property
+    def pages(self) -> list:
+        return self.get('pages')
+
+
+class Installation_Event(Event):
+    _required_keys = ('action', 'installation', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def installation(self) -> Installation:
+        return self._wrap(Installation, self.get('installation'))
+
+    @property
+    def repositories(self) -> list:
+        return self.get('repositories')
+
+    @memoized
+    def requester(self) -> Optional[Collaborator]:
+        data = self.get('requester')
+        return self._wrap(Collaborator, data) if data else None
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Installation_Repositories_Event(Event):
+    _required_keys = ('action', 'installation', 'sender')
+    _optional_keys = {'repositories_added': [], 'repositories_removed': [], 'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def installation(self) -> Installation:
+        return self._wrap(Installation, self.get('installation'))
+
+    @property
+    def repository_selection(self) -> str:
+        return self.get('repository_selection')
+
+    @property
+    def repositories_added(self) -> list:
+        return self.get('repositories_added')
+
+    @property
+    def repositories_removed(self) -> list:
+        return self.get('repositories_removed')
+
+    @memoized
+    def requester(self) -> Optional[Collaborator]:
+        data = self.get('requester')
+        return self._wrap(Collaborator, data) if data else None
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Issue_Comment_Event(Event):
+    _required_keys = ('action', 'issue', 'comment', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def issue(self) -> Issue:
+        return self._wrap(Issue, self.get('issue'))
+
+    @memoized
+    def comment(self) -> Comment:
+        return self._wrap(Comment, self.get('comment'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Issues_Event(Event):
+    _required_keys = ('action', 'issue', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def issue(self) -> Issue:
+        return self._wrap(Issue, self.get('issue'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def label(self) -> Optional[Label]:
+        data = self.get('label')
+        return self._wrap(Label, data) if data else None
+
+    @memoized
+    def assignee(self) -> Optional[Collaborator]:
+        data = self.get('assignee')
+        return self._wrap(Collaborator, data) if data else None
+
+    @memoized
+    def milestone(self) -> Optional[Milestone]:
+        data = self.get('milestone')
+        return self._wrap(Milestone, data) if data else None
+
+
+class Label_Event(Event):
+    _required_keys = ('action', 'label', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def label(self) -> Label:
+        return self._wrap(Label, self.get('label'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Marketplace_Purchase_Event(Event):
+    _required_keys = ('action', 'effective_date', 'marketplace_purchase', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def effective_date(self) -> datetime:
+        return parse_timestamp(self.get('effective_date'))
+
+    @property
+    def marketplace_purchase(self) -> dict:
+        return self.get('marketplace_purchase')
+
+    @property
+    def previous_marketplace_purchase(self) -> dict:
+        return self.get('previous_marketplace_purchase')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Member_Event(Event):
+    _required_keys = ('action', 'member', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def member(self) -> Collaborator:
+        return self._wrap(Collaborator, self.get('member'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Membership_Event(Event):
+    _required_keys = ('action', 'scope', 'member', 'team', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def scope(self) -> str:
+        return self.get('scope')
+
+    @memoized
+    def member(self) -> Collaborator:
+        return self._wrap(Collaborator, self.get('member'))
+
+    @memoized
+    def team(self) -> Team:
+        return self._wrap(Team, self.get('team'))
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Meta_Event(Event):
+    _required_keys = ('action', 'hook_id', 'hook', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def hook_id(self) -> int:
+        return self.get('hook_id')
+
+    @property
+    def hook(self) -> dict:
+        return self.get('hook')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Milestone_Event(Event):
+    _required_keys = ('action', 'milestone', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def milestone(self) -> Milestone:
+        return self._wrap(Milestone, self.get('milestone'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Org_Block_Event(Event):
+    _required_keys = ('action', 'blocked_user', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def blocked_user(self) -> Collaborator:
+        return self._wrap(Collaborator, self.get('blocked_user'))
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Organization_Event(Event):
+    _required_keys = ('action', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def membership(self) -> dict:
+        return self.get('membership')
+
+    @property
+    def invitation(self) -> dict:
+        return self.get('invitation')
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Package_Event(Event):
+    _required_keys = ('action', 'package', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def package(self) -> Package:
+        return self._wrap(Package, self.get('package'))
+
+
+class Page_Build_Event(Event):
+    _required_keys = ('id', 'build', 'repository', 'sender')
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def build(self) -> dict:
+        return self.get('build')
+
+
+class Ping_Event(Event):
+    _required_keys = ('zen', 'hook_id')
+    _optional_keys = {'repository': None, 'sender': None}
+
+    @property
+    def zen(self) -> str:
+        return self.get('zen')
+
+    @property
+    def hook_id(self) -> int:
+        return self.get('hook_id')
+
+    @property
+    def hook(self) -> dict:
+        return self.get('hook')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+    @memoized
+    def sender(self) -> Optional[Collaborator]:
+        data = self.get('sender')
+        return self._wrap(Collaborator, data) if data else None
+
+
+class Project_Event(Event):
+    _required_keys = ('action', 'project', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def project(self) -> Project:
+        return self._wrap(Project, self.get('project'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Project_Card_Event(Event):
+    _required_keys = ('action', 'project_card', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def project_card(self) -> ProjectCard:
+        return self._wrap(ProjectCard, self.get('project_card'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Project_Column_Event(Event):
+    _required_keys = ('action', 'project_column', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def project_column(self) -> ProjectColumn:
+        return self._wrap(ProjectColumn, self.get('project_column'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Public_Event(Event):
+    _required_keys = ('repository', 'sender')
+
+
+class Pull_Request_Event(Event):
+    _required_keys = ('action', 'number', 'pull_request', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def number(self) -> int:
+        return self.get('number')
+
+    @memoized
+    def pull_request(self) -> PullRequest:
+        return self._wrap(PullRequest, self.get('pull_request'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def label(self) -> Optional[Label]:
+        data = self.get('label')
+        return self._wrap(Label, data) if data else None
+
+    @memoized
+    def assignee(self) -> Optional[Collaborator]:
+        data = self.get('assignee')
+        return self._wrap(Collaborator, data) if data else None
+
+    @memoized
+    def requested_reviewer(self) -> Optional[Collaborator]:
+        data = self.get('requested_reviewer')
+        return self._wrap(Collaborator, data) if data else None
+
+    @property
+    def before(self) -> str:
+        return self.get('before')
+
+    @property
+    def after(self) -> str:
+        return self.get('after')
+
+
+class Pull_Request_Review_Event(Event):
+    _required_keys = ('action', 'review', 'pull_request', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def review(self) -> Review:
+        return self._wrap(Review, self.get('review'))
+
+    @memoized
+    def pull_request(self) -> PullRequest:
+        return self._wrap(PullRequest, self.get('pull_request'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Pull_Request_Review_Comment_Event(Event):
+    _required_keys = ('action', 'comment', 'pull_request', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def comment(self) -> Comment:
+        return self._wrap(Comment, self.get('comment'))
+
+    @memoized
+    def pull_request(self) -> PullRequest:
+        return self._wrap(PullRequest, self.get('pull_request'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Repository_Event(Event):
+    _required_keys = ('action', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+
+class Repository_Dispatch_Event(Event):
+    _required_keys = ('action', 'branch', 'repository', 'sender')
+    _optional_keys = {'client_payload': {}}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def branch(self) -> str:
+        return self.get('branch')
+
+    @property
+    def client_payload(self) -> dict:
+        return self.get('client_payload')
+
+
+class Repository_Import_Event(Event):
+    _required_keys = ('status', 'repository', 'sender')
+
+    @property
+    def status(self) -> str:
+        return self.get('status')
+
+
+class Repository_Vulnerability_Alert_Event(Event):
+    _required_keys = ('action', 'alert', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def alert(self) -> dict:
+        return self.get('alert')
+
+
+class Secret_Scanning_Alert_Event(Event):
+    _required_keys = ('action', 'alert', 'repository')
+    _optional_keys = {'sender': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def alert(self) -> Alert:
+        return self._wrap(Alert, self.get('alert'))
+
+    @memoized
+    def sender(self) -> Optional[Collaborator]:
+        data = self.get('sender')
+        return self._wrap(Collaborator, data) if data else None
+
+
+class Security_Advisory_Event(Event):
+    _required_keys = ('action', 'security_advisory')
+    _optional_keys = {'repository': None, 'sender': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def security_advisory(self) -> dict:
+        return self.get('security_advisory')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+    @memoized
+    def sender(self) -> Optional[Collaborator]:
+        data = self.get('sender')
+        return self._wrap(Collaborator, data) if data else None
+
+
+class Sponsorship_Event(Event):
+    _required_keys = ('action', 'sponsorship', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @property
+    def sponsorship(self) -> dict:
+        return self.get('sponsorship')
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def effective_date(self) -> Optional[datetime]:
+        value = self.get('effective_date')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Star_Event(Event):
+    _required_keys = ('action', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def starred_at(self) -> Optional[datetime]:
+        value = self.get('starred_at')
+        return parse_timestamp(value) if value else None
+
+
+class Status_Event(Event):
+    _required_keys = ('id', 'sha', 'state', 'context', 'repository', 'sender')
+    _optional_keys = {'branches': []}
+
+    @property
+    def id(self) -> int:
+        return self.get('id')
+
+    @property
+    def sha(self) -> str:
+        return self.get('sha')
+
+    @property
+    def name(self) -> str:
+        return self.get('name')
+
+    @property
+    def state(self) -> str:
+        return self.get('state')
+
+    @property
+    def context(self) -> str:
+        return self.get('context')
+
+    @property
+    def description(self) -> str:
+        return self.get('description')
+
+    @property
+    def target_url(self) -> str:
+        return self.get('target_url')
+
+    @property
+    def commit(self) -> dict:
+        return self.get('commit')
+
+    @property
+    def branches(self) -> list:
+        return self.get('branches')
+
+    @memoized
+    def created_at(self) -> Optional[datetime]:
+        value = self.get('created_at')
+        return parse_timestamp(value) if value else None
+
+    @memoized
+    def updated_at(self) -> Optional[datetime]:
+        value = self.get('updated_at')
+        return parse_timestamp(value) if value else None
+
+
+class Team_Event(Event):
+    _required_keys = ('action', 'team', 'sender')
+    _optional_keys = {'repository': None}
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def team(self) -> Team:
+        return self._wrap(Team, self.get('team'))
+
+    @property
+    def changes(self) -> dict:
+        return self.get('changes')
+
+    @memoized
+    def repository(self) -> Optional[Repository]:
+        data = self.get('repository')
+        return self._wrap(Repository, data) if data else None
+
+
+class Team_Add_Event(Event):
+    _required_keys = ('team', 'repository', 'sender')
+
+    @memoized
+    def team(self) -> Team:
+        return self._wrap(Team, self.get('team'))
+
+
+class Watch_Event(Event):
+    _required_keys = ('action', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+
+class Workflow_Dispatch_Event(Event):
+    _required_keys = ('ref', 'workflow', 'repository', 'sender')
+
+    @property
+    def ref(self) -> str:
+        return self.get('ref')
+
+    @property
+    def workflow(self) -> str:
+        return self.get('workflow')
+
+    @property
+    def inputs(self) -> dict:
+        return self.get('inputs')
+
+
+class Workflow_Job_Event(Event):
+    _required_keys = ('action', 'workflow_job', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def workflow_job(self) -> WorkflowJob:
+        return self._wrap(WorkflowJob, self.get('workflow_job'))
+
+
+class Workflow_Run_Event(Event):
+    _required_keys = ('action', 'workflow_run', 'workflow', 'repository', 'sender')
+
+    @property
+    def action(self) -> str:
+        return self.get('action')
+
+    @memoized
+    def workflow_run(self) -> WorkflowRun:
+        return self._wrap(WorkflowRun, self.get('workflow_run'))
+
+    @memoized
+    def workflow(self) -> Workflow:
+        return self._wrap(Workflow, self.get('workflow'))
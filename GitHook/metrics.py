@@ -0,0 +1,138 @@
+import bisect
+import threading
+from typing import Dict, Sequence, Tuple, List
+
+DELIVERIES = 'githook_deliveries_total'
+DELIVERY_BYTES = 'githook_delivery_bytes'
+HANDLER_CALLS = 'githook_handler_calls_total'
+HANDLER_SECONDS = 'githook_handler_seconds'
+SIGNATURE_FAILURES = 'githook_signature_failures_total'
+DEDUP_HITS = 'githook_dedup_hits_total'
+REJECTED = 'githook_rejected_total'
+COALESCED = 'githook_coalesced_total'
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+class MetricsSink:
+    def increment(self, name: str, labels: Dict[str, str], value: float = 1):
+        pass
+
+    def observe(self, name: str, labels: Dict[str, str], value: float):
+        pass
+
+
+class InMemorySink(MetricsSink):
+    def __init__(self):
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._observations: Dict[Tuple[str, Labels], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, labels: Dict[str, str], value: float = 1):
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float):
+        key = (name, _labels(labels))
+        with self._lock:
+            self._observations.setdefault(key, []).append(value)
+
+    # Totals over every series of the metric whose labels include the given ones
+    def counter(self, name: str, **labels) -> float:
+        wanted = set(labels.items())
+        return sum(value for (metric, series), value in self._counters.items()
+                   if metric == name and wanted.issubset(series))
+
+    def observations(self, name: str, **labels) -> List[float]:
+        wanted = set(labels.items())
+        return [value for (metric, series), values in self._observations.items()
+                if metric == name and wanted.issubset(series) for value in values]
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+            self._observations.clear()
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: str = None) -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra is not None:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+class PrometheusSink(MetricsSink):
+    def __init__(self, buckets: Dict[str, Sequence[float]] = None):
+        self._buckets = {DELIVERY_BYTES: SIZE_BUCKETS, HANDLER_SECONDS: LATENCY_BUCKETS}
+        self._buckets.update(buckets or {})
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, labels: Dict[str, str], value: float = 1):
+        series = _labels(labels)
+        with self._lock:
+            counters = self._counters.setdefault(name, {})
+            counters[series] = counters.get(series, 0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float):
+        series = _labels(labels)
+        with self._lock:
+            histograms = self._histograms.setdefault(name, {})
+            histogram = histograms.get(series)
+            if histogram is None:
+                histogram = histograms[series] = _Histogram(tuple(sorted(self._buckets.get(name, LATENCY_BUCKETS))))
+            histogram.observe(value)
+
+    # Text exposition format 0.0.4
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, counters in sorted(self._counters.items()):
+                lines.append(f'# TYPE {name} counter')
+                for series, value in counters.items():
+                    lines.append(f'{name}{_format_labels(series)} {value}')
+
+            for name, histograms in sorted(self._histograms.items()):
+                lines.append(f'# TYPE {name} histogram')
+                for series, histogram in histograms.items():
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        bucket = _format_labels(series, f'le="{bound}"')
+                        lines.append(f'{name}_bucket{bucket} {cumulative}')
+                    bucket = _format_labels(series, 'le="+Inf"')
+                    lines.append(f'{name}_bucket{bucket} {histogram.count}')
+                    lines.append(f'{name}_sum{_format_labels(series)} {histogram.sum}')
+                    lines.append(f'{name}_count{_format_labels(series)} {histogram.count}')
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,232 @@
+import asyncio
+import functools
+import heapq
+import inspect
+import itertools
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional
+
+_logger = logging.getLogger("webhook")
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class HandlerOverrunError(TimeoutError):
+    # The handler timed out and is still running, it is not retried while it could overlap the retry
+    pass
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        assert threshold > 0, 'threshold must be positive'
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() >= self._opened_at + self._reset_timeout:
+                # Let a single probe through, its outcome decides whether the circuit closes again
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record(self, succeeded: bool):
+        with self._lock:
+            if succeeded:
+                self._state = self.CLOSED
+                self._failures = 0
+                return
+
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self._threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def reset(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() >= self._opened_at + self._reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def __repr__(self):
+        return f'<CircuitBreaker {self.state} failures={self._failures}>'
+
+
+class HandlerPolicy:
+    def __init__(self, timeout: float = None, retries: int = 0, backoff: float = 0.5, max_backoff: float = 30.0,
+                 breaker_threshold: int = None, breaker_reset: float = 30.0, timeout_workers: int = 4):
+        assert retries >= 0, 'retries can not be negative'
+        assert timeout_workers > 0, 'timeout_workers must be positive'
+        self.timeout = timeout
+        # Threads of each handler's own pool when a timeout is set, a hung handler only ties up its own
+        self.timeout_workers = timeout_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+
+    def delay(self, attempt: int) -> float:
+        return min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+
+
+class _Scheduler:
+    # One daemon thread running delayed jobs, keeps retries off the request path
+    def __init__(self, name: str = 'githook-retries'):
+        self._name = name
+        self._jobs = []
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def schedule(self, delay: float, job: Callable[[], None]):
+        with self._condition:
+            heapq.heappush(self._jobs, (time.monotonic() + delay, next(self._order), job))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._jobs or self._jobs[0][0] > time.monotonic():
+                    self._condition.wait(self._jobs[0][0] - time.monotonic() if self._jobs else None)
+                _, _, job = heapq.heappop(self._jobs)
+
+            try:
+                job()
+            except Exception:
+                _logger.exception('Scheduled job failed')
+
+    def cancel(self):
+        with self._condition:
+            self._jobs.clear()
+
+
+_scheduler = _Scheduler()
+_timed_handlers: 'weakref.WeakSet[PolicyHandler]' = weakref.WeakSet()
+
+
+def _after_fork():
+    # A forked process keeps the pools' bookkeeping but none of their threads, each handler starts a fresh pool
+    for handler in _timed_handlers:
+        handler._timeouts = ThreadPoolExecutor(handler.policy.timeout_workers, thread_name_prefix='githook-timeouts')
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def _call(func, event):
+    result = func(event)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
+
+
+class PolicyHandler:
+    def __init__(self, func: Callable, policy: HandlerPolicy):
+        self._func = func
+        self._policy = policy
+        self._breaker = CircuitBreaker(policy.breaker_threshold, policy.breaker_reset) \
+            if policy.breaker_threshold is not None else None
+        self._timeouts = ThreadPoolExecutor(policy.timeout_workers, thread_name_prefix='githook-timeouts') \
+            if policy.timeout is not None else None
+        if self._timeouts is not None:
+            _timed_handlers.add(self)
+        functools.update_wrapper(self, func)
+
+    # retried is called once a background retry succeeds, the dispatch uses it to checkpoint the spooled delivery
+    def __call__(self, event, retried: Callable[[], None] = None):
+        if self._breaker is not None and not self._breaker.allow():
+            raise CircuitOpenError(f'Circuit of {self.__qualname__} is open')
+
+        try:
+            result = self._invoke(event)
+        except Exception as e:
+            self._record(False)
+            if self._policy.retries and not isinstance(e, HandlerOverrunError):
+                _scheduler.schedule(self._policy.delay(1), functools.partial(self._retry, event, 1, retried))
+            raise
+
+        self._record(True)
+        return result
+
+    def _invoke(self, event):
+        if self._policy.timeout is None:
+            return _call(self._func, event)
+
+        future = self._timeouts.submit(_call, self._func, event)
+        try:
+            return future.result(self._policy.timeout)
+        except FutureTimeoutError:
+            # Calls still queued behind hung ones are dropped, a running one keeps its thread and is only given up on
+            if future.cancel():
+                raise
+            raise HandlerOverrunError(f'{self.__qualname__} overran its {self._policy.timeout}s timeout') from None
+
+    def _record(self, succeeded: bool):
+        if self._breaker is not None:
+            self._breaker.record(succeeded)
+
+    def _retry(self, event, attempt: int, retried: Optional[Callable[[], None]]):
+        if self._breaker is not None and not self._breaker.allow():
+            return
+
+        try:
+            self._invoke(event)
+        except Exception as e:
+            self._record(False)
+            _logger.exception(f'Retry {attempt} of {self.__qualname__} failed')
+            if attempt < self._policy.retries and not isinstance(e, HandlerOverrunError):
+                _scheduler.schedule(self._policy.delay(attempt + 1),
+                                    functools.partial(self._retry, event, attempt + 1, retried))
+            return
+
+        self._record(True)
+        if retried is not None:
+            retried()
+
+    @property
+    def retries(self) -> bool:
+        return self._policy.retries > 0
+
+    @property
+    def func(self) -> Callable:
+        return self._func
+
+    @property
+    def policy(self) -> HandlerPolicy:
+        return self._policy
+
+    @property
+    def breaker(self) -> Optional[CircuitBreaker]:
+        return self._breaker
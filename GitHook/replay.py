@@ -0,0 +1,156 @@
+import hashlib
+import hmac
+import importlib
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from flask import Flask, request
+
+from GitHook import events
+from GitHook.api import Webhook
+
+SAMPLES = os.path.join(os.path.dirname(__file__), 'samples', 'deliveries.jsonl')
+_SKIPPED_HEADERS = ('host', 'content-length')
+
+
+class Delivery:
+    __slots__ = ('endpoint', 'headers', 'body')
+
+    def __init__(self, endpoint: str, headers: Dict[str, str], body: bytes):
+        self.endpoint = endpoint
+        self.headers = headers
+        self.body = body
+
+    @property
+    def event(self) -> str:
+        for key, value in self.headers.items():
+            if key.lower() == 'x-github-event':
+                return value
+        return 'unknown'
+
+    def signed(self, secret: bytes) -> 'Delivery':
+        headers = {key: value for key, value in self.headers.items() if not key.lower().startswith('x-hub-signature')}
+        headers['X-Hub-Signature-256'] = 'sha256=' + hmac.new(secret, self.body, hashlib.sha256).hexdigest()
+        headers['X-Hub-Signature'] = 'sha1=' + hmac.new(secret, self.body, hashlib.sha1).hexdigest()
+        return Delivery(self.endpoint, headers, self.body)
+
+    def to_json(self) -> str:
+        return json.dumps({'endpoint': self.endpoint, 'headers': self.headers, 'body': self.body.decode('utf-8')})
+
+    @staticmethod
+    def from_json(line: str) -> 'Delivery':
+        data = json.loads(line)
+        return Delivery(data['endpoint'], data['headers'], data['body'].encode('utf-8'))
+
+
+def load(path: str = SAMPLES) -> List[Delivery]:
+    with open(path, 'r', encoding='utf-8') as file:
+        return [Delivery.from_json(line) for line in file if line.strip()]
+
+
+def recorder(output: str, endpoint: str = '/') -> Flask:
+    app = Flask('GitHook.recorder')
+    lock = threading.Lock()
+
+    def record():
+        headers = {key: value for key, value in request.headers.items() if key.lower() not in _SKIPPED_HEADERS}
+        delivery = Delivery(request.path, headers, request.get_data())
+        with lock, open(output, 'a', encoding='utf-8') as file:
+            file.write(delivery.to_json() + '\n')
+        return '', 204
+
+    app.add_url_rule(endpoint, 'record', record, methods=['POST'])
+    if endpoint == '/':
+        app.add_url_rule('/<path:path>', 'record_any', lambda path: record(), methods=['POST'])
+    return app
+
+
+def load_target(target: str) -> Flask:
+    module, _, attribute = target.partition(':')
+    value = getattr(importlib.import_module(module), attribute or 'webhook')
+    return value.app if isinstance(value, Webhook) else value
+
+
+def sink(deliveries: Iterable[Delivery], codec: str = None) -> Flask:
+    # A webhook with a no-op handler for every recorded event, measures the library's own overhead
+    webhook = Webhook(Flask('GitHook.sink'), codec=codec)
+    # One handler per endpoint and event, however many deliveries were recorded for it
+    for endpoint, name in sorted({(delivery.endpoint, delivery.event) for delivery in deliveries}):
+        event = getattr(events, name.title() + '_Event', None)
+        if event is not None:
+            webhook.add_hook(lambda e: None, event, endpoint)
+    return webhook.app
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    # Nearest rank
+    return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+
+def replay(app: Flask, deliveries: List[Delivery], concurrency: int = 1, rate: float = None, repeat: int = 1,
+           secret: Optional[bytes] = None) -> dict:
+    if secret is not None:
+        deliveries = [delivery.signed(secret) for delivery in deliveries]
+    jobs = [delivery for _ in range(repeat) for delivery in deliveries]
+
+    results: Dict[str, Dict[str, list]] = {}
+    lock = threading.Lock()
+    local = threading.local()
+    start = time.perf_counter()
+
+    def send(index: int, delivery: Delivery):
+        if rate:
+            delay = start + index / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = app.test_client()
+
+        began = time.perf_counter()
+        try:
+            status = client.post(delivery.endpoint, data=delivery.body, headers=delivery.headers).status_code
+        except Exception:
+            status = 500
+        latency = time.perf_counter() - began
+
+        with lock:
+            result = results.setdefault(delivery.event, {'latencies': [], 'failures': 0})
+            result['latencies'].append(latency)
+            if status >= 400:
+                result['failures'] += 1
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(send, index, delivery) for index, delivery in enumerate(jobs)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+
+    report = {'deliveries': len(jobs), 'seconds': elapsed, 'throughput': len(jobs) / elapsed if elapsed else 0.0,
+              'events': {}}
+    for event, result in sorted(results.items()):
+        latencies = sorted(result['latencies'])
+        report['events'][event] = {
+            'count': len(latencies),
+            'failures': result['failures'],
+            'p50': _percentile(latencies, 50),
+            'p95': _percentile(latencies, 95),
+            'p99': _percentile(latencies, 99),
+        }
+    return report
+
+
+def format_report(report: dict) -> str:
+    lines = [f"{report['deliveries']} deliveries in {report['seconds']:.3f}s ({report['throughput']:.1f}/s)",
+             f"{'event':<24}{'count':>8}{'failures':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+    for event, stats in report['events'].items():
+        lines.append(f"{event:<24}{stats['count']:>8}{stats['failures']:>10}"
+                     f"{stats['p50'] * 1000:>10.3f}{stats['p95'] * 1000:>10.3f}{stats['p99'] * 1000:>10.3f}")
+    return '\n'.join(lines)
@@ -0,0 +1,129 @@
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Callable, Dict
+
+from flask import Flask
+from werkzeug.serving import make_server
+
+_logger = logging.getLogger("webhook")
+
+REUSEPORT = 'reuseport'
+ACCEPTOR = 'acceptor'
+MODES = (REUSEPORT, ACCEPTOR)
+
+# A worker dying sooner than this after being forked is treated as a startup failure and not respawned
+_MIN_LIFETIME = 1.0
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def bind(host: str, port: int, reuse_port: bool = False, listen: bool = True, backlog: int = 128) -> socket.socket:
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    if listen:
+        sock.listen(backlog)
+    return sock
+
+
+def _serve(app: Flask, host: str, port: int, sock: socket.socket):
+    server = make_server(host, port, app, threaded=True, fd=sock.fileno())
+    previous = signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        server.server_close()
+
+
+def run_acceptor(app: Flask, host: str, port: int):
+    # Parsing and verification stay in this process, the webhook's dispatcher ships handlers elsewhere
+    sock = bind(host, port)
+    try:
+        _logger.info(f"Accepting deliveries on {host}:{sock.getsockname()[1]}")
+        _serve(app, host, sock.getsockname()[1], sock)
+    finally:
+        sock.close()
+
+
+def run_workers(app: Flask, host: str, port: int, workers: int, on_fork: Callable[[], None] = None,
+                on_exit: Callable[[], None] = None):
+    assert workers > 0, 'workers must be positive'
+
+    reuse_port = hasattr(socket, 'SO_REUSEPORT')
+    # With SO_REUSEPORT the parent only reserves the port (an unlistened socket gets no connections) and every
+    # worker listens on a socket of its own, so the kernel spreads connections. Without it the workers share
+    # the parent's listening socket
+    reserved = bind(host, port, reuse_port, listen=not reuse_port)
+    port = reserved.getsockname()[1]
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid:
+            children[pid] = time.monotonic()
+            return
+
+        code = 0
+        try:
+            signal.signal(signal.SIGTERM, _interrupt)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            if on_fork is not None:
+                on_fork()
+            if reuse_port:
+                reserved.close()
+            sock = bind(host, port, True) if reuse_port else reserved
+            _serve(app, host, port, sock)
+            if on_exit is not None:
+                on_exit()
+        except BaseException:
+            _logger.exception(f"Worker {os.getpid()} failed")
+            code = 1
+        finally:
+            # Never unwind back into the parent's stack
+            os._exit(code)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    previous = {signum: signal.signal(signum, stop) for signum in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        for _ in range(workers):
+            spawn()
+        _logger.info(f"Serving on {host}:{port} with {workers} workers")
+
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            started = children.pop(pid, None)
+            if started is None or stopping:
+                continue
+            if time.monotonic() - started < _MIN_LIFETIME:
+                _logger.error(f"Worker {pid} exited right after starting, not respawning it")
+                continue
+            _logger.warning(f"Worker {pid} exited with status {status}, respawning it")
+            spawn()
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        reserved.close()
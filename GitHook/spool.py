@@ -0,0 +1,168 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import AbstractSet, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class Spool:
+    def append(self, endpoint: str, headers: Dict[str, str], body: bytes) -> int:
+        raise NotImplementedError
+
+    def ack(self, entry: int):
+        raise NotImplementedError
+
+    def pending(self) -> Iterator[Tuple[int, str, Dict[str, str], bytes]]:
+        raise NotImplementedError
+
+    # Records handlers of an entry that succeeded, a replay of the entry skips them
+    def checkpoint(self, entry: int, handlers: Iterable[str]):
+        pass
+
+    def completed(self, entry: int) -> AbstractSet[str]:
+        return frozenset()
+
+    # Counts a replay of the entry, False once it ran out of attempts and was moved to the dead letters
+    def attempt(self, entry: int) -> bool:
+        return True
+
+    def dead_letters(self) -> Iterator[Tuple[int, str, Dict[str, str], bytes]]:
+        return iter(())
+
+    # Called in a freshly forked worker, spools holding connections or handles open new ones
+    def reopen(self):
+        pass
+
+    def close(self):
+        pass
+
+
+_COLUMNS = (
+    ('attempts', 'INTEGER NOT NULL DEFAULT 0'),
+    ('completed', "TEXT NOT NULL DEFAULT '[]'"),
+    ('dead', 'INTEGER NOT NULL DEFAULT 0'),
+)
+
+
+class SQLiteSpool(Spool):
+    def __init__(self, path: str, batch_size: int = 1, flush_interval: float = 0.01, max_attempts: Optional[int] = 5):
+        assert batch_size > 0, 'batch_size must be positive'
+        assert max_attempts is None or max_attempts > 0, 'max_attempts must be positive'
+        self._max_attempts = max_attempts
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._uncommitted = 0
+        self._generation = 0
+        self._condition = threading.Condition()
+        self._path = path
+        self._connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, timeout=30, check_same_thread=False)
+        if self._path != ':memory:':
+            connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=FULL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS spool (id INTEGER PRIMARY KEY AUTOINCREMENT, endpoint TEXT NOT NULL, '
+            'headers TEXT NOT NULL, body BLOB NOT NULL)'
+        )
+        # Spools written before checkpoints existed get the columns added
+        columns = {row[1] for row in connection.execute('PRAGMA table_info(spool)')}
+        for column, definition in _COLUMNS:
+            if column not in columns:
+                connection.execute(f'ALTER TABLE spool ADD COLUMN {column} {definition}')
+        connection.commit()
+        return connection
+
+    def append(self, endpoint: str, headers: Dict[str, str], body: bytes) -> int:
+        with self._condition:
+            entry = self._connection.execute(
+                'INSERT INTO spool (endpoint, headers, body) VALUES (?, ?, ?)', (endpoint, json.dumps(headers), body)
+            ).lastrowid
+            self._uncommitted += 1
+
+            # Group commit, callers only return once the transaction holding their entry is on disk
+            generation = self._generation
+            if self._uncommitted >= self._batch_size:
+                self._commit()
+            else:
+                deadline = time.monotonic() + self._flush_interval
+                while self._generation == generation:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._commit()
+                        break
+                    self._condition.wait(remaining)
+
+        return entry
+
+    def _commit(self):
+        self._connection.commit()
+        self._uncommitted = 0
+        self._generation += 1
+        self._condition.notify_all()
+
+    def ack(self, entry: int):
+        # Acks ride along with the next commit, losing one only means the delivery is replayed again
+        with self._condition:
+            self._connection.execute('DELETE FROM spool WHERE id = ?', (entry,))
+            if self._batch_size == 1:
+                self._commit()
+
+    def checkpoint(self, entry: int, handlers: Iterable[str]):
+        with self._condition:
+            row = self._connection.execute('SELECT completed FROM spool WHERE id = ?', (entry,)).fetchone()
+            if row is None:
+                return
+            completed = sorted(set(json.loads(row[0])).union(handlers))
+            self._connection.execute('UPDATE spool SET completed = ? WHERE id = ?', (json.dumps(completed), entry))
+            if self._batch_size == 1:
+                self._commit()
+
+    def completed(self, entry: int) -> AbstractSet[str]:
+        with self._condition:
+            row = self._connection.execute('SELECT completed FROM spool WHERE id = ?', (entry,)).fetchone()
+        return frozenset(json.loads(row[0])) if row is not None else frozenset()
+
+    def attempt(self, entry: int) -> bool:
+        # Committed before the replay runs, a delivery that crashes the process still uses up its attempts
+        with self._condition:
+            row = self._connection.execute('SELECT attempts FROM spool WHERE id = ?', (entry,)).fetchone()
+            if row is None:
+                return False
+            attempts = row[0] + 1
+            dead = self._max_attempts is not None and attempts > self._max_attempts
+            self._connection.execute('UPDATE spool SET attempts = ?, dead = ? WHERE id = ?',
+                                     (attempts, int(dead), entry))
+            self._commit()
+        return not dead
+
+    def _rows(self, dead: bool) -> Iterator[Tuple[int, str, Dict[str, str], bytes]]:
+        with self._condition:
+            rows = self._connection.execute(
+                'SELECT id, endpoint, headers, body FROM spool WHERE dead = ? ORDER BY id', (int(dead),)
+            ).fetchall()
+        for entry, endpoint, headers, body in rows:
+            yield entry, endpoint, json.loads(headers), bytes(body)
+
+    def pending(self) -> Iterator[Tuple[int, str, Dict[str, str], bytes]]:
+        return self._rows(False)
+
+    def dead_letters(self) -> Iterator[Tuple[int, str, Dict[str, str], bytes]]:
+        # Kept until acked so they can be inspected
+        return self._rows(True)
+
+    @property
+    def max_attempts(self) -> Optional[int]:
+        return self._max_attempts
+
+    def reopen(self):
+        # Uncommitted entries belong to the parent's transaction, the worker starts from a clean one
+        self._uncommitted = 0
+        self._condition = threading.Condition()
+        self._connection = self._connect()
+
+    def close(self):
+        with self._condition:
+            self._commit()
+            self._connection.close()
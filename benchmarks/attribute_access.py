@@ -0,0 +1,70 @@
+# Microbenchmark of attribute access on Push_Event and Repository, for every representation
+# Run from the repository root: python -m benchmarks.attribute_access
+import argparse
+import json
+import timeit
+from operator import attrgetter, methodcaller
+from typing import Callable, Dict, List, Optional
+
+from GitHook.classes import DataHolder, Repository
+from GitHook.events import Push_Event
+from GitHook.replay import SAMPLES, load
+
+REPRESENTATIONS = {
+    'full': lambda holder: holder,
+    'compact': lambda holder: holder.compact_class(),
+    'lazy': lambda holder: holder.lazy_class(),
+}
+
+# Attribute paths timed on each holder
+PATHS = {
+    Push_Event: {'declared property': 'ref', 'memoized, warm': 'repository', 'nested chain': 'repository.owner.login'},
+    Repository: {'declared property': 'name', 'memoized, warm': 'owner', 'nested chain': 'owner.login'},
+}
+
+
+def best_of(func, number: int, repeat: int) -> float:
+    # Seconds per call of the fastest run, the slower ones are noise from the rest of the machine
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def undeclared(holder: type, data: dict) -> Optional[str]:
+    # A payload key without a property, served by the __getattr__ fallback
+    return next((key for key in data if not hasattr(holder, key)), None)
+
+
+def cases(holder: type, data: dict) -> Dict[str, Callable[[DataHolder], object]]:
+    found = {name: attrgetter(path) for name, path in PATHS[holder].items()}
+    found['get()'] = methodcaller('get', PATHS[holder]['declared property'])
+    key = undeclared(holder, data)
+    if key is not None:
+        found[f'undeclared key ({key})'] = attrgetter(key)
+    return found
+
+
+def run(samples: Dict[type, dict], number: int, repeat: int):
+    print(f"{'holder':<14}{'access':<40}" + ''.join(f'{name + " ns":>14}' for name in REPRESENTATIONS))
+    for holder, data in samples.items():
+        built = {name: represent(holder)(data) for name, represent in REPRESENTATIONS.items()}
+        for name, access in cases(holder, data).items():
+            row = f'{holder.__name__:<14}{name:<40}'
+            for item in built.values():
+                access(item)
+                row += f'{best_of(lambda: access(item), number, repeat) * 1e9:>14.1f}'
+            print(row)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.attribute_access',
+                                     description='Time attribute access on the event and repository holders')
+    parser.add_argument('--input', default=SAMPLES, help='recorded deliveries, the first push is used')
+    parser.add_argument('--number', type=int, default=200000, help='accesses per timed run')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs, the fastest is reported')
+    args = parser.parse_args(argv)
+
+    push = json.loads(next(delivery for delivery in load(args.input) if delivery.event == 'push').body)
+    run({Push_Event: push, Repository: push['repository']}, args.number, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+# Times get_codec(name).loads on the bundled sample deliveries for every installed JSON backend
+# Run from the repository root: python -m benchmarks.codec_loads
+import argparse
+import timeit
+from typing import List
+
+from GitHook.api import JSON_CODECS, get_codec
+from GitHook.replay import SAMPLES, Delivery, load
+
+
+def best_of(func, number: int, repeat: int) -> float:
+    # Seconds per call of the fastest run, the slower ones are noise from the rest of the machine
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def run(deliveries: List[Delivery], number: int, repeat: int):
+    backends = []
+    for name in JSON_CODECS:
+        try:
+            backends.append(get_codec(name))
+        except ImportError:
+            print(f'{name} is not installed, skipping it')
+
+    print(f"{'event':<16}{'bytes':>8}" + ''.join(f'{codec.name + " us":>14}' for codec in backends))
+    for delivery in deliveries:
+        row = f'{delivery.event:<16}{len(delivery.body):>8}'
+        for codec in backends:
+            body = delivery.body
+            row += f'{best_of(lambda: codec.loads(body), number, repeat) * 1e6:>14.2f}'
+        print(row)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.codec_loads',
+                                     description='Time the JSON backends on recorded deliveries')
+    parser.add_argument('input', nargs='?', default=SAMPLES, help='recorded deliveries, the bundled samples by default')
+    parser.add_argument('--number', type=int, default=2000, help='calls per timed run')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs, the fastest is reported')
+    args = parser.parse_args(argv)
+    run(load(args.input), args.number, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
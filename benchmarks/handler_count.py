@@ -0,0 +1,63 @@
+# Measures how the cost of a delivery grows with the number of handlers registered for its event
+# Run from the repository root: python -m benchmarks.handler_count
+import argparse
+import json
+import timeit
+from typing import List
+
+from flask import Flask
+
+from GitHook.api import Webhook, _run_handlers
+from GitHook.events import Push_Event
+from GitHook.replay import SAMPLES, load
+
+
+def best_of(func, number: int, repeat: int) -> float:
+    # Seconds per call of the fastest run, the slower ones are noise from the rest of the machine
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def make_handler():
+    def handler(event: Push_Event):
+        return event.ref
+    return handler
+
+
+def run(body: bytes, counts: List[int], number: int, repeat: int):
+    data = json.loads(body)
+    headers = {'X-Github-Event': 'push', 'content-type': 'application/json'}
+
+    print(f"{'handlers':>8}{'dispatch us':>14}{'per handler':>14}{'event per handler us':>22}{'request us':>14}")
+    for count in counts:
+        app = Flask('benchmark')
+        webhook = Webhook(app)
+        for _ in range(count):
+            webhook.add_hook(make_handler(), Push_Event, '/')
+        hook = webhook.get_hook('/')
+        client = app.test_client()
+
+        # The event is built once and shared by every handler
+        dispatch = best_of(lambda: _run_handlers(hook.handlers('push', data), data), number, repeat)
+        # What building an event for every handler would cost on top of the calls
+        rebuilt = best_of(lambda: [Push_Event(data).ref for _ in range(count)], number, repeat)
+        # The whole request through flask, decoding and verification included
+        served = best_of(lambda: client.post('/', data=body, headers=headers), max(1, number // 10), repeat)
+        print(f'{count:>8}{dispatch * 1e6:>14.2f}{dispatch / count * 1e6:>14.2f}{rebuilt * 1e6:>22.2f}'
+              f'{served * 1e6:>14.2f}')
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.handler_count',
+                                     description='Time a push delivery against the number of handlers')
+    parser.add_argument('--input', default=SAMPLES, help='recorded deliveries, the first push is used')
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64], help='handler counts')
+    parser.add_argument('--number', type=int, default=1000, help='calls per timed run')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs, the fastest is reported')
+    args = parser.parse_args(argv)
+
+    push = next(delivery for delivery in load(args.input) if delivery.event == 'push')
+    run(push.body, args.counts, args.number, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# Compares the memory kept alive by the full, compact and lazy event representations, measured with tracemalloc
+# Run from the repository root: python -m benchmarks.holder_memory
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Callable, List
+
+from GitHook.events import Event, Push_Event, Release_Event, Pull_Request_Event
+from GitHook.replay import SAMPLES, load
+
+EVENTS = {'push': Push_Event, 'release': Release_Event, 'pull_request': Pull_Request_Event}
+REPRESENTATIONS = {
+    'full': lambda event: event,
+    'compact': lambda event: event.compact_class(),
+    'lazy': lambda event: event.lazy_class(),
+}
+
+
+def touch(event: Event):
+    # Nested holders are built on first access, a kept event usually had some of them read
+    event.repository.owner.login
+    event.sender.login
+
+
+def retained(body: bytes, build: Callable[[dict], Event], count: int) -> int:
+    # Bytes still allocated once count events are built from fresh payloads and only the events are kept
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        kept = []
+        for _ in range(count):
+            event = build(json.loads(body))
+            touch(event)
+            kept.append(event)
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+
+def run(bodies: dict, count: int):
+    print(f"{'event':<14}" + ''.join(f'{name + " KiB/event":>20}' for name in REPRESENTATIONS))
+    for name, body in bodies.items():
+        row = f'{name:<14}'
+        for represent in REPRESENTATIONS.values():
+            size = retained(body, represent(EVENTS[name]), count)
+            row += f'{size / count / 1024:>20.2f}'
+        print(row)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.holder_memory',
+                                     description='Compare the memory of the event representations')
+    parser.add_argument('--input', default=SAMPLES, help='recorded deliveries, the first of each event is used')
+    parser.add_argument('--count', type=int, default=1000, help='events kept per measurement')
+    args = parser.parse_args(argv)
+
+    bodies = {}
+    for delivery in load(args.input):
+        if delivery.event in EVENTS:
+            bodies.setdefault(delivery.event, delivery.body)
+    run(bodies, args.count)
+
+
+if __name__ == '__main__':
+    main()
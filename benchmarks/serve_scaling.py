@@ -0,0 +1,112 @@
+# Measures Webhook.serve throughput against the number of worker processes, in both serve modes.
+# Deliveries are signed so every request pays for verification, scaling needs at least as many free cores as workers
+# Run from the repository root: python -m benchmarks.serve_scaling
+import argparse
+import hashlib
+import http.client
+import logging
+import multiprocessing
+import os
+import socket
+import time
+from typing import List
+
+from flask import Flask
+
+from GitHook.api import Webhook
+from GitHook.events import Push_Event
+from GitHook.replay import SAMPLES, Delivery, load
+
+SECRET = b'benchmark'
+# Rounds of hashing per handled delivery, stands in for the work a real handler does
+WORK = 200
+
+
+def handler(event: Push_Event):
+    digest = event.after.encode()
+    for _ in range(WORK):
+        digest = hashlib.sha256(digest).digest()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def serve(port: int, workers: int, mode: str):
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    webhook = Webhook(Flask('benchmark'))
+    webhook.add_hook(handler, Push_Event, '/', secret=SECRET)
+    webhook.serve(port=port, workers=workers, mode=mode)
+
+
+def wait_for(port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def drive(port: int, delivery: Delivery, duration: float) -> int:
+    # Requests a client completed in duration seconds, the server closes every connection after a response
+    done = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        connection = http.client.HTTPConnection('127.0.0.1', port)
+        try:
+            connection.request('POST', '/', body=delivery.body, headers=delivery.headers)
+            if 200 <= connection.getresponse().status < 300:
+                done += 1
+        finally:
+            connection.close()
+    return done
+
+
+def measure(delivery: Delivery, workers: int, mode: str, clients: int, duration: float) -> float:
+    context = multiprocessing.get_context('fork')
+    port = free_port()
+    server = context.Process(target=serve, args=(port, workers, mode))
+    server.start()
+    try:
+        wait_for(port)
+        # Lets every worker finish starting before the timed run
+        drive(port, delivery, 0.2)
+        with context.Pool(clients) as pool:
+            done = pool.starmap(drive, [(port, delivery, duration)] * clients)
+        return sum(done) / duration
+    finally:
+        server.terminate()
+        server.join(10)
+
+
+def main(argv: List[str] = None):
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.serve_scaling',
+                                     description='Time Webhook.serve against the number of workers')
+    parser.add_argument('--input', default=SAMPLES, help='recorded deliveries, the first push is used')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1))), help='worker counts')
+    parser.add_argument('--modes', nargs='+', default=['reuseport', 'acceptor'], help='serve modes')
+    parser.add_argument('--clients', type=int, default=max(2, cores), help='client processes sending deliveries')
+    parser.add_argument('--duration', type=float, default=3.0, help='seconds each measurement runs')
+    args = parser.parse_args(argv)
+
+    delivery = next(delivery for delivery in load(args.input) if delivery.event == 'push').signed(SECRET)
+    print(f'{cores} cores, {args.clients} clients')
+    print(f"{'mode':<12}{'workers':>8}{'requests/s':>14}{'speedup':>10}")
+    for mode in args.modes:
+        baseline = None
+        for workers in args.workers:
+            rate = measure(delivery, workers, mode, args.clients, args.duration)
+            baseline = baseline or rate
+            print(f'{mode:<12}{workers:>8}{rate:>14.1f}{rate / baseline:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
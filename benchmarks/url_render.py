@@ -0,0 +1,62 @@
+# Microbenchmark of rendering repository URL templates such as issues_url.get_url(number=...)
+# Run from the repository root: python -m benchmarks.url_render
+import argparse
+import json
+import re
+import timeit
+from typing import List
+
+from GitHook.classes import URL, Repository
+from GitHook.replay import SAMPLES, load
+
+
+def best_of(func, number: int, repeat: int) -> float:
+    # Seconds per call of the fastest run, the slower ones are noise from the rest of the machine
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def regex_render(https: bool, host: str, args: tuple, **values) -> str:
+    # The rendering URL.get_url did before templates were compiled, scanning every argument on each call
+    url = ('https://' if https else 'http://') + host
+    for arg in args:
+        for holder in re.findall('{(.+?)}', arg):
+            value = values.get(holder[1:], '') if holder.startswith('/') else values[holder]
+            arg = arg.replace(f'{{{holder}}}', str(value))
+        url += '/' + arg if arg else ''
+    return url
+
+
+def run(data: dict, number: int, repeat: int):
+    repository = Repository(data)
+    issues = repository.issues_url
+    comments = repository.issue_comment_url
+    https, host, args = issues._https, issues._url, issues._args
+
+    cases = {
+        'issues_url.get_url(number=...)': lambda: issues.get_url(number=1347),
+        'issues_url.get_url()': lambda: issues.get_url(),
+        'issue_comment_url.get_url(number=...)': lambda: comments.get_url(number=1347),
+        'Repository(data).issues_url.get_url(...)': lambda: Repository(data).issues_url.get_url(number=1347),
+        'URL.from_str(...)': lambda: URL.from_str('https://api.github.com/repos/o/r/issues/{/number}'),
+        'per call regex, for comparison': lambda: regex_render(https, host, args, number=1347),
+    }
+
+    print(f"{'case':<44}{'us':>10}")
+    for name, case in cases.items():
+        print(f'{name:<44}{best_of(case, number, repeat) * 1e6:>10.3f}')
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.url_render',
+                                     description='Time URL template rendering on a sample repository')
+    parser.add_argument('--input', default=SAMPLES, help='recorded deliveries, the first repository is used')
+    parser.add_argument('--number', type=int, default=100000, help='calls per timed run')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs, the fastest is reported')
+    args = parser.parse_args(argv)
+
+    data = next(json.loads(delivery.body)['repository'] for delivery in load(args.input))
+    run(data, args.number, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
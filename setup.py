@@ -22,5 +22,7 @@ setuptools.setup(
     ],
     python_requires='>=3.8',
     include_package_data=True,
+    package_data={"GitHook": ["samples/*.jsonl", "schema/*.json"]},
     install_requires=["flask", "requests", "json"],
+    extras_require={"orjson": ["orjson"], "ujson": ["ujson"], "simdjson": ["pysimdjson"]},
 )